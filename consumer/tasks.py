@@ -23,12 +23,16 @@ Disclosure Service의 PUT API를 호출해 공시 정보를 저장한다.
 """
 
 import os
+import random
 import logging
+import threading
 import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 import httpx
+from celery.signals import worker_process_shutdown
 from worker import app
 
 # Configure logging
@@ -47,6 +51,20 @@ DISCLOSURE_SERVICE_URL = os.getenv(
 WORKER_API_KEY = os.getenv("WORKER_API_KEY", "")
 REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", "30"))
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))
+RETRY_BACKOFF_BASE = 0.5      # 첫 재시도 대기 (초), 시도마다 2배
+RETRY_BACKOFF_MAX = 30.0      # 재시도 대기 상한 (초)
+
+
+@lru_cache(maxsize=1024)
+def _iso_reception_date(value: str) -> str:
+    """접수일자(YYYYMMDD 또는 YYYY-MM-DD)를 ISO 8601 date-time으로 변환 (같은 날짜는 캐시 재사용)"""
+    if len(value) == 8 and value.isdigit():
+        dt = datetime.strptime(value, "%Y%m%d").replace(tzinfo=timezone.utc)
+        return dt.isoformat().replace("+00:00", "Z")
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        dt = datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        return dt.isoformat().replace("+00:00", "Z")
+    return value
 
 
 class DisclosureServiceClient:
@@ -55,6 +73,9 @@ class DisclosureServiceClient:
     
     PUT /api/disclosures/{rcept_no} 엔드포인트를 호출하여
     공시 정보를 생성/업데이트한다.
+    
+    httpx.Client는 워커 프로세스마다 첫 호출 시 한 번 생성해 keep-alive 연결을
+    재사용한다 (prefork 전 부모 프로세스에서 만든 연결을 자식이 공유하지 않도록 지연 생성).
     """
     
     def __init__(
@@ -68,6 +89,8 @@ class DisclosureServiceClient:
         self.api_key = api_key
         self.timeout = timeout
         self.max_retries = max_retries
+        self._client: Optional[httpx.Client] = None
+        self._client_lock = threading.Lock()
         
         if not self.api_key:
             logger.warning(
@@ -82,6 +105,26 @@ class DisclosureServiceClient:
             "X-Worker-API-Key": self.api_key,
         }
 
+    def _get_client(self) -> httpx.Client:
+        """공유 httpx.Client 반환 (없으면 생성)"""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        base_url=self.base_url,
+                        headers=self._get_headers(),
+                        timeout=self.timeout,
+                        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                    )
+        return self._client
+    
+    def close(self) -> None:
+        """공유 httpx.Client 연결 종료"""
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
     def _format_reception_date(self, rcept_dt: Optional[str]) -> Optional[str]:
         """DART 접수일자(YYYYMMDD)를 ISO 8601 date-time으로 변환"""
         if rcept_dt is None:
@@ -89,13 +132,7 @@ class DisclosureServiceClient:
         value = str(rcept_dt).strip()
         if not value:
             return None
-        if len(value) == 8 and value.isdigit():
-            dt = datetime.strptime(value, "%Y%m%d").replace(tzinfo=timezone.utc)
-            return dt.isoformat().replace("+00:00", "Z")
-        if len(value) == 10 and value[4] == "-" and value[7] == "-":
-            dt = datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-            return dt.isoformat().replace("+00:00", "Z")
-        return value
+        return _iso_reception_date(value)
 
     def _strip_value(self, value: Optional[str]) -> Optional[str]:
         if value is None:
@@ -116,7 +153,7 @@ class DisclosureServiceClient:
         Raises:
             httpx.HTTPError: HTTP 요청 실패 시
         """
-        url = f"{self.base_url}/api/disclosures/{rcept_no}"
+        path = f"/api/disclosures/{rcept_no}"
         
         # Celery 메시지를 Disclosure Service API 스키마에 맞게 변환
         payload = {
@@ -139,17 +176,15 @@ class DisclosureServiceClient:
 
         payload.update({k: v for k, v in optional_payload.items() if v is not None})
         
+        # 재시도 간 동일한 키를 보내 서버가 중복 쓰기를 식별할 수 있도록 함
+        headers = {"Idempotency-Key": rcept_no}
+        
         last_error = None
         for attempt in range(self.max_retries):
             try:
-                with httpx.Client(timeout=self.timeout) as client:
-                    response = client.put(
-                        url,
-                        json=payload,
-                        headers=self._get_headers()
-                    )
-                    response.raise_for_status()
-                    return response.json()
+                response = self._get_client().put(path, json=payload, headers=headers)
+                response.raise_for_status()
+                return response.json()
                     
             except httpx.HTTPStatusError as e:
                 last_error = e
@@ -175,10 +210,10 @@ class DisclosureServiceClient:
                     f"Request error (attempt {attempt + 1}/{self.max_retries}): {e}"
                 )
             
-            # 지수 백오프 대기
+            # 지수 백오프 대기 (워커들이 동시에 재시도하지 않도록 지터 추가)
             if attempt < self.max_retries - 1:
-                wait_time = (2 ** attempt) * 0.5
-                time.sleep(wait_time)
+                wait_time = RETRY_BACKOFF_BASE * (2 ** attempt) * (1 + random.uniform(0, 0.5))
+                time.sleep(min(RETRY_BACKOFF_MAX, wait_time))
         
         raise last_error
 
@@ -192,6 +227,12 @@ disclosure_client = DisclosureServiceClient(
 )
 
 
+@worker_process_shutdown.connect
+def _close_disclosure_client(**kwargs):
+    """워커 프로세스 종료 시 공유 HTTP 연결 정리"""
+    disclosure_client.close()
+
+
 @app.task(
     name="tasks.process_disclosure",
     bind=True,
@@ -29,14 +29,19 @@ app = Celery(
 # - JSON 직렬화만 허용
 # - 타임존은 Asia/Seoul 기준 사용
 # - enable_utc=False 로 설정해 로컬 타임존 기준으로 동작
-# - worker_prefetch_multiplier=1 로 한 번에 하나의 태스크만 선점
-# - task_acks_late=True 로 작업 완료 후에 ack 전송
+# - worker_prefetch_multiplier 로 프로세스당 미리 받아둘 태스크 수 지정
+#   (태스크가 짧은 HTTP 호출이라 여러 개를 선점해야 브로커 왕복 대기가 줄어듦)
+# - task_acks_late=True 로 작업 완료 후에 ack 전송 (선점된 태스크도 실패 시 재전달)
+# - broker_connection_retry_on_startup=True 로 RabbitMQ 기동 전 시작해도 재시도
+prefetch_multiplier = int(os.getenv("CELERY_PREFETCH_MULTIPLIER", "4"))
+
 app.conf.update(
     task_serializer="json",
     accept_content=["json"],
     result_serializer="json",
     timezone="Asia/Seoul",
     enable_utc=False,
-    worker_prefetch_multiplier=1,
+    worker_prefetch_multiplier=prefetch_multiplier,
     task_acks_late=True,
+    broker_connection_retry_on_startup=True,
 )
\ No newline at end of file
@@ -44,6 +44,8 @@ class DartApiConfig:
     timeout: int = 30
     max_retries: int = 5
     mock_mode: bool = False  # Mock 모드 활성화
+    rss_enabled: bool = False  # 오늘 공시 RSS 피드로 변경 감지
+    rate_limit_per_minute: int = 900  # 분당 최대 요청 수 (DART 서비스 제한 1,000건 미만)
     
     def validate(self) -> List[str]:
         """설정 유효성 검증"""
@@ -61,6 +63,9 @@ class DartApiConfig:
         if self.timeout < 1:
             errors.append(f"DART_TIMEOUT must be positive (got {self.timeout})")
         
+        if not 1 <= self.rate_limit_per_minute <= 1000:
+            errors.append(f"DART_RATE_LIMIT_PER_MINUTE must be 1-1000 (got {self.rate_limit_per_minute})")
+        
         return errors
 
 
@@ -138,6 +143,8 @@ class PollingConfig:
     target_date: Optional[str] = None
     max_fail: int = 3
     failed_log_dir: Optional[str] = None
+    rss_interval_seconds: int = 30
+    workers: int = 4                       # 공시 동시 처리 스레드 수
     
     def validate(self) -> List[str]:
         """설정 유효성 검증"""
@@ -146,6 +153,9 @@ class PollingConfig:
         if self.interval_seconds < 10:
             errors.append(f"POLL_INTERVAL must be at least 10 seconds (got {self.interval_seconds})")
         
+        if self.rss_interval_seconds < 5:
+            errors.append(f"RSS_POLL_INTERVAL must be at least 5 seconds (got {self.rss_interval_seconds})")
+        
         if self.target_date:
             if len(self.target_date) != 8 or not self.target_date.isdigit():
                 errors.append(f"TARGET_DATE must be YYYYMMDD format (got {self.target_date})")
@@ -153,6 +163,9 @@ class PollingConfig:
         if self.max_fail < 1:
             errors.append(f"MAX_FAIL must be positive (got {self.max_fail})")
         
+        if not 1 <= self.workers <= 32:
+            errors.append(f"PROCESS_WORKERS must be 1-32 (got {self.workers})")
+        
         return errors
 
 
@@ -213,6 +226,7 @@ class AppConfig:
             "dart": {
                 "api_key": self.dart.api_key[:8] + "..." if self.dart.api_key else None,
                 "timeout": self.dart.timeout,
+                "rss_enabled": self.dart.rss_enabled,
             },
             "minio": {
                 "endpoint": self.minio.endpoint,
@@ -231,6 +245,8 @@ class AppConfig:
                 "target_date": self.polling.target_date,
                 "max_fail": self.polling.max_fail,
                 "failed_log_dir": self.polling.failed_log_dir,
+                "rss_interval_seconds": self.polling.rss_interval_seconds,
+                "workers": self.polling.workers,
             },
             "health": {
                 "enabled": self.health.enabled,
@@ -332,6 +348,8 @@ def load_config() -> AppConfig:
             timeout=_get_env_int("DART_TIMEOUT", 30),
             max_retries=_get_env_int("DART_MAX_RETRIES", 5),
             mock_mode=mock_mode,
+            rss_enabled=_get_env_bool("DART_RSS_ENABLED", False),
+            rate_limit_per_minute=_get_env_int("DART_RATE_LIMIT_PER_MINUTE", 900),
         ),
         minio=MinioConfig(
             endpoint=_get_env("MINIO_ENDPOINT", ""),
@@ -354,6 +372,8 @@ def load_config() -> AppConfig:
             target_date=_get_env("TARGET_DATE"),
             max_fail=_get_env_int("MAX_FAIL", 3),
             failed_log_dir=failed_log_dir,
+            rss_interval_seconds=_get_env_int("RSS_POLL_INTERVAL", 30),
+            workers=_get_env_int("PROCESS_WORKERS", 4),
         ),
         health=HealthCheckConfig(
             enabled=_get_env_bool("HEALTH_ENABLED", True),
@@ -161,6 +161,8 @@ class DartApiHealthChecker(HealthChecker):
         self._client = client
         self._last_success: Optional[datetime] = None
         self._consecutive_failures = 0
+        # 여러 문서 처리 스레드에서 동시에 기록하므로 락으로 보호
+        self._lock = threading.Lock()
     
     def set_client(self, client):
         """클라이언트 설정"""
@@ -168,12 +170,14 @@ class DartApiHealthChecker(HealthChecker):
     
     def record_success(self):
         """성공 기록"""
-        self._last_success = datetime.now()
-        self._consecutive_failures = 0
+        with self._lock:
+            self._last_success = datetime.now()
+            self._consecutive_failures = 0
     
     def record_failure(self):
         """실패 기록"""
-        self._consecutive_failures += 1
+        with self._lock:
+            self._consecutive_failures += 1
     
     @property
     def name(self) -> str:
@@ -183,19 +187,23 @@ class DartApiHealthChecker(HealthChecker):
         import time
         start = time.time()
         
+        with self._lock:
+            last_success = self._last_success
+            consecutive_failures = self._consecutive_failures
+        
         # 최근 성공 여부로 판단 (실제 API 호출은 하지 않음)
-        if self._last_success is None:
+        if last_success is None:
             status = HealthStatus.DEGRADED
             message = "No successful API call yet"
-        elif self._consecutive_failures > 5:
+        elif consecutive_failures > 5:
             status = HealthStatus.UNHEALTHY
-            message = f"Too many consecutive failures: {self._consecutive_failures}"
-        elif self._consecutive_failures > 0:
+            message = f"Too many consecutive failures: {consecutive_failures}"
+        elif consecutive_failures > 0:
             status = HealthStatus.DEGRADED
-            message = f"Recent failures: {self._consecutive_failures}"
+            message = f"Recent failures: {consecutive_failures}"
         else:
             status = HealthStatus.HEALTHY
-            message = f"Last success: {self._last_success.isoformat()}"
+            message = f"Last success: {last_success.isoformat()}"
         
         return CheckResult(
             name=self.name,
@@ -203,8 +211,8 @@ class DartApiHealthChecker(HealthChecker):
             message=message,
             latency_ms=(time.time() - start) * 1000,
             details={
-                "last_success": self._last_success.isoformat() if self._last_success else None,
-                "consecutive_failures": self._consecutive_failures,
+                "last_success": last_success.isoformat() if last_success else None,
+                "consecutive_failures": consecutive_failures,
             },
         )
 
@@ -217,6 +225,8 @@ class PollingHealthChecker(HealthChecker):
         self._last_poll: Optional[datetime] = None
         self._processed_count = 0
         self._error_count = 0
+        # 여러 문서 처리 스레드에서 동시에 기록하므로 락으로 보호
+        self._lock = threading.Lock()
     
     @property
     def name(self) -> str:
@@ -229,10 +239,12 @@ class PollingHealthChecker(HealthChecker):
         self._last_poll = datetime.now()
     
     def record_processed(self, count: int = 1):
-        self._processed_count += count
+        with self._lock:
+            self._processed_count += count
     
     def record_error(self, count: int = 1):
-        self._error_count += count
+        with self._lock:
+            self._error_count += count
     
     def check(self) -> CheckResult:
         import time
@@ -402,6 +414,9 @@ class HealthCheckServer:
     별도 스레드에서 실행되어 메인 프로세스와 독립적으로 동작한다.
     """
     
+    # serve_forever가 종료 요청을 확인하는 주기 (초) - stop() 지연 상한이자 유휴 시 깨어나는 간격
+    POLL_INTERVAL_SECONDS = 0.5
+    
     def __init__(self, host: str = "0.0.0.0", port: int = 8001):
         self.host = host
         self.port = port
@@ -449,13 +464,18 @@ class HealthCheckServer:
             raise
     
     def _serve_forever(self):
-        """서버 루프"""
-        while self._running and self._server:
-            try:
-                self._server.handle_request()
-            except Exception as e:
-                if self._running:
-                    logger.error(f"Health check server error: {e}")
+        """
+        서버 루프.
+        
+        serve_forever는 POLL_INTERVAL_SECONDS(0.5초, 2Hz)마다 selector 대기에서 깨어나
+        종료 요청을 확인하므로, stop()의 shutdown() 호출은 최대 그 시간만큼 기다린다.
+        간격을 늘리면 유휴 시 깨어나는 횟수는 줄지만 종료가 그만큼 늦어진다.
+        """
+        try:
+            self._server.serve_forever(poll_interval=self.POLL_INTERVAL_SECONDS)
+        except Exception as e:
+            if self._running:
+                logger.error(f"Health check server error: {e}")
     
     def stop(self):
         """서버 중지"""
@@ -463,6 +483,7 @@ class HealthCheckServer:
         
         if self._server:
             self._server.shutdown()
+            self._server.server_close()
             self._server = None
         
         if self._thread and self._thread.is_alive():
@@ -21,9 +21,11 @@ import time
 import logging
 import signal
 import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Set, Dict, Optional
-from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
 
 from dotenv import load_dotenv
 from celery import Celery
@@ -31,7 +33,7 @@ from celery import Celery
 # 로컬 모듈
 from config import get_config, AppConfig, ConfigValidationError
 from health import start_health_server, HealthCheckServer
-from services.dart_api_client import DartApiClient, DartApiError, DartApiStatus
+from services.dart_api_client import DartApiClient, DartApiCancelledError, DartApiError, DartApiStatus
 from services.mock_dart_client import MockDartApiClient, get_dart_client
 from services.storage_client import MinIOClient
 from services.content_normalizer import normalize_payload
@@ -62,6 +64,35 @@ def setup_logging(log_level: str) -> logging.Logger:
 # 상태 관리 클래스 (전역 상태 캡슐화)
 # ============================================================
 
+# 메모리에 유지할 최대 접수번호 수 (하루 공시량보다 충분히 큼)
+MAX_TRACKED_RCEPT_NOS = 50_000
+
+
+class BoundedSet:
+    """
+    최대 크기가 정해진 삽입 순서 기반 집합.
+    
+    용량을 넘으면 가장 오래된 항목부터 제거하여
+    장기 실행 시에도 메모리 사용량이 일정하게 유지된다.
+    """
+    
+    def __init__(self, capacity: int = MAX_TRACKED_RCEPT_NOS):
+        self.capacity = capacity
+        self._items: "OrderedDict[str, None]" = OrderedDict()
+    
+    def add(self, item: str):
+        self._items[item] = None
+        self._items.move_to_end(item)
+        if len(self._items) > self.capacity:
+            self._items.popitem(last=False)
+    
+    def __contains__(self, item: object) -> bool:
+        return item in self._items
+    
+    def __len__(self) -> int:
+        return len(self._items)
+
+
 @dataclass
 class ProcessingState:
     """
@@ -69,33 +100,47 @@ class ProcessingState:
     
     기존 전역 변수(PROCESSED_RCEPT_NOS, FAILED_ATTEMPTS, PERM_FAILED)를
     클래스로 캡슐화하여 테스트 용이성과 상태 관리를 개선한다.
+    여러 처리 스레드에서 동시에 호출되므로 모든 상태 변경은 락으로 보호한다.
     """
-    processed: Set[str] = field(default_factory=set)
+    processed: BoundedSet = field(default_factory=BoundedSet)
     failed_attempts: Dict[str, int] = field(default_factory=dict)
-    permanently_failed: Set[str] = field(default_factory=set)
+    permanently_failed: BoundedSet = field(default_factory=BoundedSet)
     
     # 통계
     success_count: int = 0
     skip_count: int = 0
     error_count: int = 0
     
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    
     def is_processed(self, rcept_no: str) -> bool:
         """이미 처리된 공시인지 확인"""
-        return rcept_no in self.processed or rcept_no in self.permanently_failed
+        with self._lock:
+            return rcept_no in self.processed or rcept_no in self.permanently_failed
+    
+    def unprocessed(self, rcept_nos: Iterable[Optional[str]]) -> Set[Optional[str]]:
+        """주어진 접수번호 중 아직 처리되지 않은 것만 반환 (락 한 번으로 일괄 확인)"""
+        with self._lock:
+            return {
+                rcept_no for rcept_no in rcept_nos
+                if rcept_no not in self.processed and rcept_no not in self.permanently_failed
+            }
     
     def mark_processed(self, rcept_no: str):
         """처리 완료로 마킹"""
-        self.processed.add(rcept_no)
-        self.success_count += 1
-        
-        # 실패 기록 제거
-        if rcept_no in self.failed_attempts:
-            del self.failed_attempts[rcept_no]
+        with self._lock:
+            self.processed.add(rcept_no)
+            self.success_count += 1
+            
+            # 실패 기록 제거
+            if rcept_no in self.failed_attempts:
+                del self.failed_attempts[rcept_no]
     
     def mark_skipped(self, rcept_no: str):
         """스킵으로 마킹"""
-        self.processed.add(rcept_no)
-        self.skip_count += 1
+        with self._lock:
+            self.processed.add(rcept_no)
+            self.skip_count += 1
     
     def record_failure(self, rcept_no: str, max_fail: int) -> bool:
         """
@@ -104,27 +149,29 @@ class ProcessingState:
         Returns:
             bool: True면 영구 실패로 마킹됨
         """
-        self.failed_attempts[rcept_no] = self.failed_attempts.get(rcept_no, 0) + 1
-        self.error_count += 1
-        
-        if self.failed_attempts[rcept_no] >= max_fail:
-            self.permanently_failed.add(rcept_no)
-            self.processed.add(rcept_no)
-            del self.failed_attempts[rcept_no]
-            return True
-        
-        return False
+        with self._lock:
+            self.failed_attempts[rcept_no] = self.failed_attempts.get(rcept_no, 0) + 1
+            self.error_count += 1
+            
+            if self.failed_attempts[rcept_no] >= max_fail:
+                self.permanently_failed.add(rcept_no)
+                self.processed.add(rcept_no)
+                del self.failed_attempts[rcept_no]
+                return True
+            
+            return False
     
     def get_stats(self) -> Dict:
         """통계 반환"""
-        return {
-            "processed_count": len(self.processed),
-            "success_count": self.success_count,
-            "skip_count": self.skip_count,
-            "error_count": self.error_count,
-            "pending_retry_count": len(self.failed_attempts),
-            "permanently_failed_count": len(self.permanently_failed),
-        }
+        with self._lock:
+            return {
+                "processed_count": len(self.processed),
+                "success_count": self.success_count,
+                "skip_count": self.skip_count,
+                "error_count": self.error_count,
+                "pending_retry_count": len(self.failed_attempts),
+                "permanently_failed_count": len(self.permanently_failed),
+            }
 
 
 # ============================================================
@@ -143,6 +190,11 @@ class GracefulShutdown:
         logging.getLogger(__name__).info(f"Received signal {signum}, initiating shutdown...")
         self._shutdown_event.set()
     
+    @property
+    def event(self) -> threading.Event:
+        """종료 신호 이벤트 (다른 컴포넌트의 대기를 함께 깨우는 용도)"""
+        return self._shutdown_event
+    
     def is_shutting_down(self) -> bool:
         return self._shutdown_event.is_set()
     
@@ -160,6 +212,25 @@ class GracefulShutdown:
 # 문서 처리 함수
 # ============================================================
 
+# 정규화 후 이 크기보다 작은 문서는 본문이 없는 것으로 보고 스킵
+MIN_FILE_SIZE_BYTES = 200
+
+
+def _log_header(doc: Disclosure) -> str:
+    """처리 로그 공통 헤더"""
+    return f"| {doc.rcept_dt} | {doc.rcept_no} | {doc.corp_name:<15} | {doc.report_nm[:50]}"
+
+
+def list_stored_rcept_nos(store: MinIOClient, date: str) -> Optional[Set[str]]:
+    """날짜 접두사 아래에 저장된 객체들의 접수번호 집합 (목록 조회 실패 시 None)"""
+    prefix = f"{date}/"
+    names = store.list_object_names(prefix)
+    if names is None:
+        return None
+    start = len(prefix)
+    return {name[start:start + 14] for name in names}
+
+
 def process_document(
     api: DartApiClient,
     store: MinIOClient,
@@ -169,9 +240,9 @@ def process_document(
     config: AppConfig,
     failure_recorder: FailureRecorder,
     health_server: Optional[HealthCheckServer],
-    celery_app: Celery,
     logger: logging.Logger,
-):
+    stored_rcept_nos: Optional[Set[str]] = None,
+) -> Optional[Dict[str, Any]]:
     """
     단일 공시 문서 처리.
     
@@ -179,23 +250,35 @@ def process_document(
     2. 원문 다운로드
     3. 인코딩 변환
     4. MinIO 업로드
-    5. Celery 메시지 발행
+    5. Celery 메시지 생성 (발행은 publish_messages에서 페이지/배치 단위로 수행)
+    
+    Args:
+        stored_rcept_nos: polling_date 아래에 이미 저장된 접수번호 (None이면 객체별로 저장소 조회)
+    
+    Returns:
+        업로드에 성공하면 Celery 메시지, 그 외에는 None
     """
-    log_header = f"| {doc.rcept_dt} | {doc.rcept_no} | {doc.corp_name:<15} | {doc.report_nm[:50]}"
+    rcept_no = doc.rcept_no
+    rcept_dt = doc.rcept_dt
+    log_header = _log_header(doc)
     
     # 이미 처리된 공시 스킵
-    if state.is_processed(doc.rcept_no):
-        return
-    
-    # MinIO에 이미 존재하는지 확인
-    if store.object_exists(f"{doc.rcept_dt}/{doc.rcept_no}*"):
-        state.mark_skipped(doc.rcept_no)
+    if state.is_processed(rcept_no):
+        return None
+    
+    # MinIO에 이미 존재하는지 확인 (사이클 단위 목록이 있으면 요청 없이 확인)
+    if stored_rcept_nos is not None and rcept_dt == polling_date:
+        exists = rcept_no in stored_rcept_nos
+    else:
+        exists = store.object_exists(f"{rcept_dt}/{rcept_no}*")
+    if exists:
+        state.mark_skipped(rcept_no)
         logger.info(f"SKIPPED   {log_header} | Reason: Already exists in storage.")
-        return
+        return None
     
     try:
         # 1. DART API에서 원문 다운로드
-        zip_bytes = api.fetch_document_content(doc.rcept_no)
+        zip_bytes = api.fetch_document_content(rcept_no)
         if not zip_bytes:
             raise ValueError("Failed to download document from DART API.")
         
@@ -203,27 +286,28 @@ def process_document(
             health_server.record_dart_success()
         
         # 2. 콘텐츠 정규화 (ZIP 해제, 인코딩 변환)
-        context = asdict(doc)
+        context = doc.to_dict()
         context["polling_date"] = polling_date
         
         content_type, normalized_body, final_filename = normalize_payload(
-            object_key=doc.rcept_no,
+            object_key=rcept_no,
             body=zip_bytes,
             log_context=context,
         )
+        del zip_bytes  # 원본 ZIP 버퍼는 업로드 전에 해제
         
         file_size = len(normalized_body)
         
         # 너무 작은 파일은 스킵
-        if file_size < 200:
+        if file_size < MIN_FILE_SIZE_BYTES:
             reason = f"Processed file too small ({file_size} bytes)."
             logger.warning(f"SKIPPED   {log_header} | Reason: {reason}")
-            state.mark_skipped(doc.rcept_no)
+            state.mark_skipped(rcept_no)
             failure_recorder.record(doc, reason)
-            return
+            return None
         
         # 3. MinIO 업로드
-        object_name = f"{doc.rcept_dt}/{final_filename}"
+        object_name = f"{rcept_dt}/{final_filename}"
         if not store.upload_document(object_name, normalized_body, content_type):
             raise IOError(f"Failed to upload {object_name} to storage.")
         
@@ -236,9 +320,9 @@ def process_document(
             "stock_code": doc.stock_code,
             "corp_cls": doc.corp_cls,
             "report_nm": doc.report_nm,
-            "rcept_no": doc.rcept_no,
+            "rcept_no": rcept_no,
             "flr_nm": doc.flr_nm,
-            "rcept_dt": doc.rcept_dt,
+            "rcept_dt": rcept_dt,
             "rm": doc.rm,
             "object_key": object_name,
             "content_type": content_type,
@@ -246,22 +330,18 @@ def process_document(
             "polling_date": polling_date,
         }
         
-        try:
-            celery_app.send_task(
-                config.celery.task_name,
-                kwargs=message,
-            )
-            logger.info(f"ENQUEUED  {log_header} | object_key={object_name}")
-        except Exception as e:
-            error_reason = f"Failed to enqueue Celery task: {e}"
-            logger.error(f"FAILED    {log_header} | Error: {error_reason}")
-            failure_recorder.record(doc, error_reason)
-        
-        state.mark_processed(doc.rcept_no)
+        state.mark_processed(rcept_no)
         
         if health_server:
             health_server.record_processed()
         
+        return message
+        
+    except DartApiCancelledError:
+        # 종료 신호로 다운로드하지 않은 경우는 실패로 기록하지 않음 (다음 실행에서 다시 처리)
+        logger.info(f"CANCELLED {log_header} | Reason: Shutdown requested.")
+        return None
+        
     except Exception as e:
         error_reason = str(e)
         logger.error(f"FAILED    {log_header} | Error: {error_reason}")
@@ -271,19 +351,120 @@ def process_document(
             health_server.record_error()
             health_server.record_dart_failure()
         
-        is_permanent = state.record_failure(doc.rcept_no, config.polling.max_fail)
+        is_permanent = state.record_failure(rcept_no, config.polling.max_fail)
         
         if is_permanent:
             logger.critical(
-                f"CRITICAL  | {doc.rcept_dt} | {doc.rcept_no} | "
+                f"CRITICAL  | {rcept_dt} | {rcept_no} | "
                 f"Permanently failed after {config.polling.max_fail} retries."
             )
+        
+        return None
+
+
+# 사이클 마무리 시 끝난 문서의 메시지를 이 개수 단위로 발행
+PUBLISH_BATCH_SIZE = 20
+
+
+def publish_messages(
+    celery_app: Celery,
+    config: AppConfig,
+    items: List[Tuple[Disclosure, Dict[str, Any]]],
+    failure_recorder: FailureRecorder,
+    logger: logging.Logger,
+):
+    """
+    한 배치의 Celery 메시지를 하나의 producer로 연속 발행.
+    
+    메시지마다 producer/채널을 새로 얻지 않아 브로커 왕복 비용이 줄어든다.
+    """
+    if not items:
+        return
+    
+    sent = 0
+    try:
+        with celery_app.producer_or_acquire() as producer:
+            for doc, message in items:
+                try:
+                    celery_app.send_task(
+                        config.celery.task_name,
+                        kwargs=message,
+                        producer=producer,
+                    )
+                    logger.info(f"ENQUEUED  {_log_header(doc)} | object_key={message['object_key']}")
+                except Exception as e:
+                    error_reason = f"Failed to enqueue Celery task: {e}"
+                    logger.error(f"FAILED    {_log_header(doc)} | Error: {error_reason}")
+                    failure_recorder.record(doc, error_reason)
+                sent += 1
+    except Exception as e:
+        # producer 획득 실패 시 남은 메시지를 모두 실패로 기록
+        error_reason = f"Failed to enqueue Celery task: {e}"
+        for doc, _ in items[sent:]:
+            logger.error(f"FAILED    {_log_header(doc)} | Error: {error_reason}")
+            failure_recorder.record(doc, error_reason)
+
+
+def publish_completed(
+    celery_app: Celery,
+    config: AppConfig,
+    futures: Dict[Future, Disclosure],
+    failure_recorder: FailureRecorder,
+    logger: logging.Logger,
+    wait: bool = False,
+):
+    """
+    끝난 문서 처리 결과의 메시지를 발행하고 futures에서 제거.
+    
+    wait=False면 이미 끝난 것만 발행하고, True면 모두 끝날 때까지 기다리며
+    PUBLISH_BATCH_SIZE개씩 발행한다. 업로드 후 발행까지의 간격을 사이클 전체가 아닌
+    페이지/배치 단위로 줄여, 그 사이 장애로 메시지가 유실되는 범위를 좁힌다.
+    """
+    pending = list(futures) if wait else [future for future in futures if future.done()]
+    batch: List[Tuple[Disclosure, Dict[str, Any]]] = []
+    
+    for future in as_completed(pending):
+        doc = futures.pop(future)
+        try:
+            message = future.result()
+        except Exception as e:
+            logger.error(f"Unexpected error in document worker: {e}", exc_info=True)
+            continue
+        if message:
+            batch.append((doc, message))
+        if len(batch) >= PUBLISH_BATCH_SIZE:
+            publish_messages(celery_app, config, batch, failure_recorder, logger)
+            batch = []
+    
+    publish_messages(celery_app, config, batch, failure_recorder, logger)
 
 
 # ============================================================
 # 메인 폴링 루프
 # ============================================================
 
+def has_new_rss_disclosures(
+    api: DartApiClient,
+    state: ProcessingState,
+    logger: logging.Logger,
+) -> bool:
+    """
+    RSS 피드에 아직 처리하지 않은 공시가 올라왔는지 확인.
+    
+    피드 조회에 실패하면 False를 반환하여 정기 폴링 주기에 맡긴다.
+    """
+    try:
+        rcept_nos = api.fetch_rss_updates()
+    except Exception as e:
+        logger.warning(f"RSS check failed: {e}")
+        return False
+    
+    if not rcept_nos:
+        return False
+    
+    return any(not state.is_processed(rcept_no) for rcept_no in rcept_nos)
+
+
 def polling_loop(
     api: DartApiClient,
     store: MinIOClient,
@@ -299,15 +480,46 @@ def polling_loop(
     DART API 폴링 메인 루프.
     
     주기적으로 공시 목록을 조회하고 새 공시를 처리한다.
+    RSS 모드에서는 짧은 주기로 RSS 피드만 확인하다가 새 공시가 보이면
+    즉시 목록을 조회하고, 그렇지 않아도 POLL_INTERVAL마다 전체 폴링을 수행한다.
+    RSS로 감지된 조회는 페이지를 미리 요청하지 않고, 새 공시가 없는 페이지에서 멈춘다.
+    새 공시와 2페이지 이후의 목록 페이지는 PROCESS_WORKERS 개의 스레드에서 병렬로 처리한다.
     """
     target_date = config.polling.target_date
     interval = config.polling.interval_seconds
     
+    # RSS 피드는 오늘 공시만 제공하므로 고정 날짜 폴링에서는 사용하지 않음
+    use_rss = config.dart.rss_enabled and not target_date
+    wait_seconds = config.polling.rss_interval_seconds if use_rss else interval
+    last_poll_at: Optional[float] = None
+    
+    if use_rss:
+        logger.info(f"RSS change detection enabled (check every {wait_seconds}s, full poll every {interval}s)")
+    
+    # 공시 처리 스레드 풀 (사이클 간 재사용)
+    executor = ThreadPoolExecutor(
+        max_workers=config.polling.workers,
+        thread_name_prefix="DocWorker",
+    )
+    
     # 헬스 상태 업데이트
     if health_server:
         health_server.set_polling_running(True)
     
     while not shutdown.is_shutting_down():
+        # RSS 모드: 정기 폴링 시점 전에는 피드에 새 공시가 있을 때만 목록 조회
+        rss_triggered = False
+        if use_rss and last_poll_at is not None and time.monotonic() - last_poll_at < interval:
+            if not has_new_rss_disclosures(api, state, logger):
+                if not shutdown.wait(wait_seconds):
+                    break
+                continue
+            logger.info("New disclosures detected in RSS feed.")
+            rss_triggered = True
+        else:
+            # 전체 폴링 시각만 기록 (RSS로 감지된 조회는 정기 전체 폴링을 미루지 않음)
+            last_poll_at = time.monotonic()
+        
         try:
             # 날짜 결정 (고정 날짜 또는 오늘)
             yyyymmdd = target_date or datetime.now().strftime('%Y%m%d')
@@ -316,97 +528,147 @@ def polling_loop(
             if health_server:
                 health_server.record_poll()
             
-            all_disclosures = []
+            def process_if_running(doc: Disclosure, stored_rcept_nos: Optional[Set[str]]) -> Optional[Dict[str, Any]]:
+                # 종료 신호 이후에는 대기 중인 작업을 처리하지 않음
+                if shutdown.is_shutting_down():
+                    return None
+                return process_document(
+                    api=api,
+                    store=store,
+                    doc=doc,
+                    polling_date=yyyymmdd,
+                    state=state,
+                    config=config,
+                    failure_recorder=failure_recorder,
+                    health_server=health_server,
+                    logger=logger,
+                    stored_rcept_nos=stored_rcept_nos,
+                )
+            
+            # 페이지를 받는 즉시 새 공시 처리를 시작해 다음 페이지 조회와 문서 처리를 겹침
+            futures: Dict[Future, Disclosure] = {}
+            submitted = 0
+            # 조회 중 새 공시가 추가되면 항목이 다음 페이지로 밀려 중복될 수 있으므로 사이클 단위로 제거
+            queued_rcept_nos: Set[str] = set()
+            # 저장소 중복 확인용 목록은 새 공시가 처음 나올 때 한 번만 조회
+            stored_rcept_nos: Optional[Set[str]] = None
+            storage_listed = False
             page_no = 1
             total_pages = 1
+            # 2페이지 이후는 첫 페이지에서 total_page를 확인한 뒤 스레드 풀에서 미리 요청
+            prefetched: Dict[int, Future] = {}
+            # API 상태에 따른 대기 시간 (업로드된 문서의 메시지를 먼저 발행한 뒤 대기)
+            backoff_seconds = 0
             
             # 페이지네이션 처리
-            while page_no <= total_pages:
-                if shutdown.is_shutting_down():
-                    break
-                
-                try:
-                    response = api.fetch_disclosures(date=yyyymmdd, page_no=page_no, page_count=100)
-                    
-                    if response is None:
-                        logger.error("API request returned None")
+            try:
+                while page_no <= total_pages:
+                    if shutdown.is_shutting_down():
                         break
                     
-                    status_code = response.get('status', '')
-                    
-                    if status_code == DartApiStatus.SUCCESS:
-                        if page_no == 1:
-                            total_pages = int(response.get('total_page', 1))
-                            total_count = int(response.get('total_count', 0))
-                            logger.info(f"Total disclosures for {yyyymmdd}: {total_count} (pages: {total_pages})")
+                    try:
+                        if page_no in prefetched:
+                            response = prefetched.pop(page_no).result()
+                        else:
+                            response = api.fetch_disclosures(date=yyyymmdd, page_no=page_no, page_count=100)
                         
-                        raw_list = response.get('list', [])
-                        if not raw_list and page_no > 1:
+                        if response is None:
+                            logger.error("API request returned None")
                             break
                         
-                        for item in raw_list:
-                            try:
-                                all_disclosures.append(Disclosure.from_dict(item))
-                            except TypeError as e:
-                                logger.warning(f"Failed to parse disclosure item: {e}")
-                        
-                        page_no += 1
-                        
-                    elif status_code == DartApiStatus.NO_DATA:
-                        logger.info(f"No disclosures found for {yyyymmdd}")
-                        break
+                        status_code = response.get('status', '')
                         
-                    elif status_code == DartApiStatus.RATE_LIMIT_EXCEEDED:
-                        logger.warning("Daily API rate limit exceeded. Waiting 1 hour...")
-                        shutdown.wait(3600)
-                        break
-                        
-                    elif status_code == DartApiStatus.SYSTEM_MAINTENANCE:
-                        logger.warning("DART system under maintenance. Waiting 5 minutes...")
-                        shutdown.wait(300)
-                        break
-                        
-                    elif status_code in (DartApiStatus.INVALID_KEY, DartApiStatus.DISABLED_KEY):
-                        logger.critical(f"API key error (status={status_code}). Check DART_API_KEY.")
-                        shutdown.wait(interval)
+                        if status_code == DartApiStatus.SUCCESS:
+                            if page_no == 1:
+                                total_pages = int(response.get('total_page', 1))
+                                total_count = int(response.get('total_count', 0))
+                                logger.info(f"Total disclosures for {yyyymmdd}: {total_count} (pages: {total_pages})")
+                                # RSS로 감지된 조회는 앞 페이지에서 끝나는 경우가 대부분이므로 미리 요청하지 않음
+                                if not rss_triggered:
+                                    prefetched = {
+                                        p: executor.submit(api.fetch_disclosures, date=yyyymmdd, page_no=p, page_count=100)
+                                        for p in range(2, total_pages + 1)
+                                    }
+                            
+                            raw_list = response.get('list', [])
+                            if not raw_list and page_no > 1:
+                                break
+                            
+                            # 접수번호만 먼저 걸러내고 새 공시만 Disclosure 객체로 변환
+                            new_rcept_nos = state.unprocessed(item.get('rcept_no') for item in raw_list)
+                            new_rcept_nos -= queued_rcept_nos
+                            # 목록은 최신순이므로 RSS로 감지된 조회는 새 공시가 없는 페이지에서 중단 (일일 요청 한도 절약)
+                            if rss_triggered and not new_rcept_nos:
+                                logger.info(f"No unprocessed disclosures on page {page_no}; stopping RSS-triggered poll.")
+                                break
+                            if new_rcept_nos and not storage_listed:
+                                stored_rcept_nos = list_stored_rcept_nos(store, yyyymmdd)
+                                storage_listed = True
+                            for item in raw_list:
+                                rcept_no = item.get('rcept_no')
+                                if rcept_no not in new_rcept_nos:
+                                    continue
+                                new_rcept_nos.discard(rcept_no)
+                                try:
+                                    doc = Disclosure.from_dict(item)
+                                    futures[executor.submit(process_if_running, doc, stored_rcept_nos)] = doc
+                                    queued_rcept_nos.add(rcept_no)
+                                    submitted += 1
+                                except TypeError as e:
+                                    logger.warning(f"Failed to parse disclosure item: {e}")
+                            
+                            # 이전 페이지까지 처리가 끝난 문서는 사이클 종료를 기다리지 않고 바로 발행
+                            publish_completed(celery_app, config, futures, failure_recorder, logger)
+                            
+                            page_no += 1
+                            
+                        elif status_code == DartApiStatus.NO_DATA:
+                            logger.info(f"No disclosures found for {yyyymmdd}")
+                            break
+                            
+                        elif status_code == DartApiStatus.RATE_LIMIT_EXCEEDED:
+                            logger.warning("Daily API rate limit exceeded. Waiting 1 hour...")
+                            backoff_seconds = 3600
+                            break
+                            
+                        elif status_code == DartApiStatus.SYSTEM_MAINTENANCE:
+                            logger.warning("DART system under maintenance. Waiting 5 minutes...")
+                            backoff_seconds = 300
+                            break
+                            
+                        elif status_code in (DartApiStatus.INVALID_KEY, DartApiStatus.DISABLED_KEY):
+                            logger.critical(f"API key error (status={status_code}). Check DART_API_KEY.")
+                            backoff_seconds = interval
+                            break
+                            
+                        else:
+                            message = response.get('message', 'Unknown error')
+                            logger.error(f"DART API error: status={status_code}, message={message}")
+                            break
+                            
+                    except DartApiCancelledError:
+                        logger.info("Pagination cancelled by shutdown.")
                         break
-                        
-                    else:
-                        message = response.get('message', 'Unknown error')
-                        logger.error(f"DART API error: status={status_code}, message={message}")
+                    
+                    except DartApiError as e:
+                        logger.error(f"DART API error during pagination: {e}")
                         break
-                        
-                except DartApiError as e:
-                    logger.error(f"DART API error during pagination: {e}")
-                    break
             
-            # 새 공시 처리
-            new_disclosures = [
-                doc for doc in all_disclosures
-                if not state.is_processed(doc.rcept_no)
-            ]
-            
-            if new_disclosures:
-                logger.info(f"Found {len(new_disclosures)} new disclosures for {yyyymmdd}.")
+            finally:
+                # 페이지 조회 중 예외가 나도 이미 업로드된 문서의 메시지는 발행 (다음 사이클에서는 처리 완료로 스킵됨)
+                # 중단된 경우 아직 시작되지 않은 페이지 요청은 취소
+                for future in prefetched.values():
+                    future.cancel()
                 
-                for doc in new_disclosures:
-                    if shutdown.is_shutting_down():
-                        break
-                    
-                    process_document(
-                        api=api,
-                        store=store,
-                        doc=doc,
-                        polling_date=yyyymmdd,
-                        state=state,
-                        config=config,
-                        failure_recorder=failure_recorder,
-                        health_server=health_server,
-                        celery_app=celery_app,
-                        logger=logger,
-                    )
-            else:
-                logger.info(f"No new disclosures found for {yyyymmdd}.")
+                # 남은 문서 처리 결과를 기다리며 배치 단위로 발행
+                if submitted:
+                    logger.info(f"Found {submitted} new disclosures for {yyyymmdd}.")
+                    publish_completed(celery_app, config, futures, failure_recorder, logger, wait=True)
+                else:
+                    logger.info(f"No new disclosures found for {yyyymmdd}.")
+            
+            if backoff_seconds:
+                shutdown.wait(backoff_seconds)
             
             # 통계 로깅
             stats = state.get_stats()
@@ -422,10 +684,12 @@ def polling_loop(
             logger.error(f"Error in polling loop: {e}", exc_info=True)
         
         finally:
-            logger.info(f"Polling finished. Waiting for {interval} seconds...")
-            if not shutdown.wait(interval):
+            logger.info(f"Polling finished. Waiting for {wait_seconds} seconds...")
+            if not shutdown.wait(wait_seconds):
                 break
     
+    executor.shutdown(wait=True, cancel_futures=True)
+    
     # 종료 시 헬스 상태 업데이트
     if health_server:
         health_server.set_polling_running(False)
@@ -489,10 +753,13 @@ def main():
             logger.warning(f"RabbitMQ connection check failed: {e}")
             health_server.set_rabbitmq_connected(False)
     
-    # 5. 클라이언트 초기화
+    # 5. 종료 핸들러 (API 요청 수 제한 대기도 종료 신호로 깨어나도록 클라이언트보다 먼저 생성)
+    shutdown = GracefulShutdown()
+    
+    # 6. 클라이언트 초기화
     try:
         # Mock 모드 또는 실제 DART API 클라이언트 선택
-        api = get_dart_client(config)
+        api = get_dart_client(config, stop_event=shutdown.event)
         
         if config.dart.mock_mode:
             logger.info("🧪 MOCK DART API client initialized")
@@ -523,13 +790,10 @@ def main():
         logger.critical(f"Failed to initialize MinIO client: {e}")
         return 1
     
-    # 6. 상태 및 실패 기록 초기화
+    # 7. 상태 및 실패 기록 초기화
     state = ProcessingState()
     failure_recorder = FailureRecorder(log_dir=config.polling.failed_log_dir)
     
-    # 7. 종료 핸들러
-    shutdown = GracefulShutdown()
-    
     # 8. 폴링 루프 시작 (별도 스레드)
     logger.info("Starting polling loop...")
     
@@ -564,6 +828,9 @@ def main():
     if health_server:
         health_server.stop()
     
+    # 대기 중인 실패 기록 저장
+    failure_recorder.close()
+    
     # 최종 통계
     stats = state.get_stats()
     logger.info(f"Final stats: {stats}")
@@ -1,7 +1,12 @@
 from dataclasses import dataclass
+from operator import itemgetter
 from typing import Optional, Dict, Any
 
-@dataclass 
+# 필수 키 목록 (DART API 명세 기준) - 한 번의 C 레벨 호출로 모두 조회
+_REQUIRED_KEYS = ('corp_code', 'corp_name', 'corp_cls', 'report_nm', 'rcept_no', 'rcept_dt')
+_get_required = itemgetter(*_REQUIRED_KEYS)
+
+@dataclass(slots=True)
 # -------------------- DART API의 단일 공시 정보를 구조화하고 유효성을 보장하는 데이터 클래스 --------------------
 class Disclosure:
     """
@@ -33,6 +38,26 @@ class Disclosure:
     rm: Optional[str] = None    # 비고 (유/코/채/넥/공/연/정/철 등)
     url: Optional[str] = None   # 공시 원문 URL (자동 생성)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        필드를 평탄한 딕셔너리로 변환한다.
+        
+        모든 필드가 문자열(또는 None)이므로 dataclasses.asdict의
+        재귀 deepcopy 없이 바로 구성한다.
+        """
+        return {
+            "corp_code": self.corp_code,
+            "corp_name": self.corp_name,
+            "stock_code": self.stock_code,
+            "corp_cls": self.corp_cls,
+            "report_nm": self.report_nm,
+            "rcept_no": self.rcept_no,
+            "flr_nm": self.flr_nm,
+            "rcept_dt": self.rcept_dt,
+            "rm": self.rm,
+            "url": self.url,
+        }
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Disclosure':
         """
@@ -51,16 +76,19 @@ class Disclosure:
         Raises:
             TypeError: 필수 키 누락 또는 타입 불일치 시
         """
-        # 필수 키 목록 (DART API 명세 기준)
-        required_keys = ['corp_code', 'corp_name', 'corp_cls', 'report_nm', 'rcept_no', 'rcept_dt']
-
         try:
-            # 필수 키 존재 및 타입 검사
-            for key in required_keys:
-                if key not in data:
-                    raise KeyError(f"Required key '{key}' is missing.")
-                if not isinstance(data.get(key), str):
-                    raise TypeError(f"Field '{key}' must be a string.")
+            # 필수 키 존재 검사 (누락 시 KeyError)
+            try:
+                values = _get_required(data)
+            except KeyError as e:
+                raise KeyError(f"Required key {e} is missing.")
+
+            # 필수 필드 타입 검사
+            if not all(isinstance(v, str) for v in values):
+                bad = next(k for k, v in zip(_REQUIRED_KEYS, values) if not isinstance(v, str))
+                raise TypeError(f"Field '{bad}' must be a string.")
+
+            corp_code, corp_name, corp_cls, report_nm, rcept_no, rcept_dt = values
 
             # stock_code: 비상장사는 빈 문자열로 반환됨 → None으로 정규화
             stock_code_raw = data.get('stock_code', '')
@@ -73,17 +101,17 @@ class Disclosure:
             rm = data.get('rm') or None
 
             return cls(
-                corp_code=data['corp_code'],
-                corp_name=data['corp_name'],
+                corp_code=corp_code,
+                corp_name=corp_name,
                 stock_code=stock_code,
-                corp_cls=data['corp_cls'],
-                report_nm=data['report_nm'],
-                rcept_no=data['rcept_no'],
+                corp_cls=corp_cls,
+                report_nm=report_nm,
+                rcept_no=rcept_no,
                 flr_nm=flr_nm,
-                rcept_dt=data['rcept_dt'],
+                rcept_dt=rcept_dt,
                 rm=rm,
                 # 접수 번호로 DART 공시 뷰어 URL 생성
-                url=f"https://dart.fss.or.kr/dsaf001/main.do?rcpNo={data['rcept_no']}"
+                url=f"https://dart.fss.or.kr/dsaf001/main.do?rcpNo={rcept_no}"
             )
         except (KeyError, TypeError) as e:
             raise TypeError(f"Failed to create Disclosure object from data: {data}. Reason: {e}")
\ No newline at end of file
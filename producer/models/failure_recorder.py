@@ -1,12 +1,27 @@
 import os
 import json
+import queue
 import logging
+import threading
 from datetime import datetime
-from dataclasses import asdict
 from models.disclosure import Disclosure 
 
+try:                                                                                        # orjson: C 구현 JSON 직렬화 (선택적)
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 LOG = logging.getLogger(__name__)
 
+
+# ---------- 실패 기록을 들여쓰기된 UTF-8 JSON 바이트로 직렬화 (orjson 우선, 없으면 표준 json) ----------
+def _dumps(data: dict) -> bytes:
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
 # -------------------- 데이터 처리 실패 시, 상세 내용을 별도의 JSON 파일로 영구 저장하는 클래스 --------------------
 class FailureRecorder:
     
@@ -16,6 +31,9 @@ class FailureRecorder:
             try:
                 os.makedirs(log_dir, exist_ok=True)                                         # 디렉토리가 없으면 생성 (이미 있어도 에러 없음)
                 self.log_dir = log_dir
+                self._queue: queue.Queue = queue.Queue()                                    # 기록 요청 큐 (호출 스레드는 put만 수행)
+                self._writer = threading.Thread(target=self._drain, name="FailureRecorder", daemon=True)
+                self._writer.start()                                                        # 파일 쓰기는 백그라운드 스레드가 전담
                 LOG.info(f"Failure recorder is enabled. Logs will be saved to: {log_dir}")
             except OSError as e:                                                            # 디렉토리 생성 중 권한 등의 문제 발생 시
                 LOG.error(f"Failed to create failure log directory {log_dir}: {e}")
@@ -24,22 +42,53 @@ class FailureRecorder:
             self.log_dir = None                                                             # 경로가 없으면 기능을 비활성화
             LOG.warning("FAILED_LOG_DIR is not set. Failure recording is disabled.")
 
-    # ---------- 실제 실패 내용을 파일로 기록하는 메서드 ----------
+    # ---------- 실패 내용을 기록 큐에 넣는 메서드 (폴링 스레드에서 호출, 디스크 I/O 없음) ----------
     def record(self, doc: Disclosure, reason: str):
         
         if not self.log_dir:                                                                # 기능이 비활성화 상태이면 아무것도 하지 않고 즉시 종료
             return
 
+        self._queue.put_nowait((doc, reason, datetime.now()))                               # 기록 시각은 호출 시점 기준
+
+    # ---------- 대기 중인 기록을 모두 파일로 쓴 뒤 writer 스레드를 종료하는 메서드 ----------
+    def close(self, timeout: float = 10.0):
+        
+        if not self.log_dir:
+            return
+
+        self._queue.put(None)                                                               # 종료 표식 (앞선 기록이 모두 처리된 뒤 도달)
+        self._writer.join(timeout)
+
+    # ---------- 백그라운드 스레드: 큐에서 꺼낸 기록을 순서대로 파일로 저장 ----------
+    def _drain(self):
+        
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            self._write(*item)
+
+    # ---------- 실제 실패 내용을 파일로 기록하는 메서드 ----------
+    def _write(self, doc: Disclosure, reason: str, recorded_at: datetime):
+
+        tmp_path = None
         try:                                                                                # 저장할 데이터 구조화: 기록 시간, 실패 원인, 원본 공시 정보
             failure_data = {
-                "recorded_at": datetime.now().isoformat(), 
+                "recorded_at": recorded_at.isoformat(), 
                 "failure_reason": reason,
-                "disclosure_details": asdict(doc)
+                "disclosure_details": doc.to_dict()
             }
             file_path = os.path.join(self.log_dir, f"{doc.rcept_no}.json")
+            tmp_path = f"{file_path}.tmp"
             
-            with open(file_path, 'w', encoding='utf-8') as f:                               # JSON 파일로 저장 (UTF-8 인코딩, 가독성을 위한 들여쓰기 적용)
-                json.dump(failure_data, f, ensure_ascii=False, indent=4)
+            with open(tmp_path, 'wb') as f:                                                 # 임시 파일에 JSON 저장 (UTF-8 인코딩, 한 번의 write로 기록)
+                f.write(_dumps(failure_data))
+            os.replace(tmp_path, file_path)                                                 # rename으로 교체하여 읽는 쪽이 부분 파일을 보지 않도록 함
                 
         except Exception as e:                                                              # 파일 쓰기 등 과정에서 예외 발생 시 에러 로그 기록
             LOG.error(f"Could not record failure for rcept_no {doc.rcept_no}: {e}")
+            if tmp_path and os.path.exists(tmp_path):                                       # 쓰다 만 임시 파일 정리
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
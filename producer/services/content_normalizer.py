@@ -5,39 +5,65 @@ DART API에서 다운로드한 공시 원문(ZIP)을 정규화하는 모듈.
 
 [개선 사항 v2.0]
 1. chardet: 인코딩 자동 감지 (선언 없는 문서 처리)
-2. BeautifulSoup: HTML charset 추출 정확도 향상  
+2. selectolax: HTML charset 추출 정확도 향상 (미설치 시 정규식)  
 3. lxml: XML 파싱 안정성 강화
 4. 상세 에러 로깅 및 graceful degradation
 
 [의존성]
-- chardet>=5.0.0
-- beautifulsoup4>=4.12.0
+- chardet>=5.0.0 (faust-cchardet 설치 시 C 구현 우선 사용)
+- selectolax>=0.3.17 (선택적, 설치 시 HTML charset 추출에 우선 사용)
 - lxml>=5.0.0 (선택적)
+- isal>=1.6.0 (선택적, 단일 멤버 ZIP CRC 검증 가속)
 """
 
 import os
 import re
+import codecs
+import struct
+import zlib
 import unicodedata
 import logging
+import functools
 from io import BytesIO
-from zipfile import ZipFile, BadZipFile
+from zipfile import ZipFile, ZipInfo, BadZipFile
 from typing import Tuple, Optional, List, Dict, Any
 
 # ==================== 외부 라이브러리 (graceful degradation) ====================
 
+# 인코딩 자동 감지기: C 확장(cchardet) 우선, 없으면 chardet, 그마저 없으면 charset-normalizer
+# (세 라이브러리 모두 chardet 호환 detect() 제공)
 try:
-    import chardet
+    import cchardet as chardet
     HAS_CHARDET = True
+    HAS_CCHARDET = True
 except ImportError:
-    HAS_CHARDET = False
-    logging.warning("chardet not installed. Encoding detection may be less accurate.")
+    HAS_CCHARDET = False
+    try:
+        import chardet
+        HAS_CHARDET = True
+    except ImportError:
+        try:
+            import charset_normalizer as chardet
+            HAS_CHARDET = True
+        except ImportError:
+            HAS_CHARDET = False
+            logging.warning("chardet not installed. Encoding detection may be less accurate.")
+
+# HTML meta 태그 추출용 C 파서 (선택적, 없으면 정규식 사용)
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
 
+# CRC32 SIMD 구현 (선택적, 없으면 표준 zlib 사용)
 try:
-    from bs4 import BeautifulSoup
-    HAS_BS4 = True
+    from isal import isal_zlib
+    HAS_ISAL = True
+    _crc32 = isal_zlib.crc32
 except ImportError:
-    HAS_BS4 = False
-    logging.warning("beautifulsoup4 not installed. HTML parsing may be less accurate.")
+    HAS_ISAL = False
+    _crc32 = zlib.crc32
 
 try:
     import lxml.etree as LxmlET
@@ -50,12 +76,25 @@ except ImportError:
 # ==================== 상수 정의 ====================
 
 READ_HEAD_N = 65536                     # 파일 종류 판별용 읽기 바이트 수
+XML_DECL_HEAD_N = 256                   # XML 선언 확인용 읽기 바이트 수
+XML_SNIFF_HEAD_N = 2048                 # 선언 없는 XML 판별용 읽기 바이트 수
+CHARDET_SAMPLE_N = 32 * 1024            # chardet 자동 감지 샘플 크기
+ENCODING_PROBE_N = 4096                 # 후보 인코딩 사전 검사용 바이트 수
 ZIP_SIG = b'PK\x03\x04'                 # ZIP 파일 시그니처
+ZIP_SIGS = (ZIP_SIG, b'PK\x05\x06', b'PK\x07\x08')  # 일반 / 빈 아카이브 / 분할 아카이브
+PDF_SIG = b'%PDF-'                      # PDF 파일 시그니처
 
 KIND_PRIORITY = ['html', 'xml', 'bin']  # ZIP 내 콘텐츠 우선순위
+MARKUP_EXTENSIONS = ('.html', '.htm', '.xml')  # 판별 대상 우선 후보 확장자
+# 압축 해제 없이 'bin'으로 분류하는 확장자 (공시 첨부 이미지/문서)
+BINARY_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tif', '.tiff', '.pdf', '.hwp', '.xls', '.xlsx', '.doc', '.docx'})
 MAX_FILES = 200                         # ZIP 내 최대 파일 수 (보안)
 MAX_TOTAL_UNCOMPRESSED = 200 * 1024 * 1024  # 최대 압축 해제 용량 (200MB)
 
+_ZIP_LOCAL_HEADER = struct.Struct('<IHHHHHIIIHH')  # ZIP 로컬 파일 헤더 (30 bytes)
+_ZIP_LOCAL_HEADER_SIG = 0x04034b50
+_ZIP_CENTRAL_DIR_SIG = b'PK\x01\x02'
+
 # 인코딩 별칭 (한국어 문서 특화)
 _ENCODING_ALIASES = {
     'ks_c_5601-1987': 'cp949',
@@ -69,30 +108,49 @@ _ENCODING_ALIASES = {
 }
 
 # 한국어 문서에서 우선 시도할 인코딩 목록
-_KOREAN_ENCODING_PRIORITY = [
+_KOREAN_ENCODING_PRIORITY = (
     'utf-8-sig',
     'utf-8',
     'cp949',      # Windows 한글
     'euc-kr',     # Unix 한글
     'iso-8859-1', # Latin-1 fallback
-]
-
-# ==================== 정규식 정의 (fallback용) ====================
+)
 
-_HTML_TAG_RE = re.compile(rb'(?is)<html[^>]*>')
-_HTML_DOCTYPE_RE = re.compile(rb'(?is)<!doctype\s+html')
-_HEAD_RE = re.compile(rb'(?is)<head[^>]*>')
-_META_ANY_RE = re.compile(
-    rb'(?is)<meta[^>]+(?:charset\s*=|http-equiv\s*=\s*["\']content-type["\'][^>]*content\s*=\s*["\']text/html;\s*charset=)'
+# 인코딩을 바로 확정할 수 있는 BOM (UTF-32를 UTF-16보다 먼저 확인)
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
 )
-_DOCTYPE_RE = re.compile(rb'(?is)\A\s*<!doctype[^>]*>\s*')
-_XML_DECL_RE = re.compile(rb'(?is)<\?xml[^>]+encoding\s*=\s*["\']?([a-zA-Z0-9._-]+)')
+
+# sniff_kind에서 제거할 BOM (UTF-8 / UTF-16 LE / UTF-16 BE)
+_BOMS = (codecs.BOM_UTF8, codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+
+# UTF-8 빠른 경로에서 유효성이 판정되는 인코딩 (후보 시도에서 제외)
+_UTF8_COMPATIBLE = frozenset({'utf-8', 'utf-8-sig', 'ascii', 'us-ascii'})
+
+# ==================== 정규식 정의 (fallback용) ====================
+# '.'을 쓰는 패턴이 없으므로 DOTALL은 지정하지 않고, 대소문자 무시는 re.IGNORECASE 플래그로 지정
+# 문서 중간에서 시작하는 태그 패턴은 [^>] 대신 [^<>]를 사용해 다음 태그로 넘어가지 않게 함
+# ('>'가 없는 비정상 입력에서 시작 위치마다 끝까지 훑는 이차 시간 역추적 방지)
+
+# HTML 감지 패턴(<html>, <!doctype html>, <head>, charset 선언 meta)을 하나로 합쳐 버퍼를 한 번만 훑음
+# 소문자로 변환한 head에 적용 (IGNORECASE 매칭보다 빠름)
+# 리터럴별 bytes 검색이나 Aho-Corasick(pyahocorasick)으로 바꿔도 64KB head 기준 더 느렸음
+# (http-equiv content-type 선언도 content 안의 charset= 로 매칭되므로 meta 패턴은 charset= 하나로 충분)
+_HTML_ANY_RE = re.compile(rb'<(?:html[^<>]*>|!doctype\s+html|head[^<>]*>|meta[^<>]+charset\s*=)')
+_HEAD_RE = re.compile(rb'<head[^<>]*>', re.IGNORECASE)
+_LEADING_WS_RE = re.compile(rb'\s*')
+_DOCTYPE_RE = re.compile(rb'\A\s*<!doctype[^>]*>\s*', re.IGNORECASE)
+_XML_DECL_RE = re.compile(rb'<\?xml[^<>]+encoding\s*=\s*["\']?([a-zA-Z0-9._-]+)', re.IGNORECASE)
 _XML_DECL_REPL = re.compile(rb'^<\?xml[^>]*\?>')
-_HTML_META_TAG_RE = re.compile(rb'(?is)<meta[^>]+charset\s*=\s*["\']?([a-zA-Z0-9._-]+)')
-_HTML_HTTP_EQUIV_RE = re.compile(
-    rb'(?is)<meta[^>]+http-equiv\s*=\s*["\']content-type["\'][^>]*content\s*=\s*["\']text/html;\s*charset=([a-zA-Z0-9._-]+)[^"\']*["\']'
-)
+_HTML_META_TAG_RE = re.compile(rb'<meta[^<>]+charset\s*=\s*["\']?([a-zA-Z0-9._-]+)', re.IGNORECASE)
+# charset 선언 meta 태그 전체 (<meta charset=...> 와 http-equiv 방식 모두, 닫는 '>'까지)
+_HTML_META_CHARSET_TAG_RE = re.compile(rb'<meta[^<>]+charset\s*=\s*["\']?[a-zA-Z0-9._-]+[^<>]*>', re.IGNORECASE)
+_CHARSET_IN_CONTENT_RE = re.compile(r'charset=([^\s;]+)', re.IGNORECASE)  # http-equiv content 속성 값 (str)
 _SAFE_NAME_RE = re.compile(r'[^A-Za-z0-9._-]+')
+_DUP_META_CHARSET_RE = re.compile(rb'(<meta\s+charset="UTF-8">\s*){2,}', re.IGNORECASE)
 
 
 # ==================== 유틸리티 함수 ====================
@@ -107,19 +165,24 @@ def _normalize_encoding_name(enc: Optional[str]) -> Optional[str]:
 
 def _normalize_filename(name: str) -> str:
     """파일명 유니코드 정규화 및 경로 제거"""
-    return unicodedata.normalize('NFC', os.path.basename(name).strip())
+    # Windows 압축 도구가 만든 '\\' 구분자도 경로로 취급 (posixpath.basename은 '/'만 처리)
+    base = name.rpartition('/')[2].rpartition('\\')[2].strip()
+    # ASCII 파일명은 NFC 정규화 결과가 같으므로 생략
+    return base if base.isascii() else unicodedata.normalize('NFC', base)
 
 
 def _safe_ascii_name(name: str) -> str:
     """안전한 ASCII 파일명 생성"""
-    n = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii')
+    n = name if name.isascii() else unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii')
     n = _SAFE_NAME_RE.sub('_', n).strip('._-')
     return n or 'document'
 
 
 def _get_base_name(filename: str) -> str:
     """확장자 제거한 파일명 반환"""
-    return os.path.splitext(_normalize_filename(filename))[0]
+    name = _normalize_filename(filename)
+    stem = name.rpartition('.')[0]
+    return stem or name  # '.'이 없거나 '.'으로 시작하는 이름은 그대로
 
 
 # ==================== 콘텐츠 감지 ====================
@@ -131,40 +194,48 @@ def sniff_kind(data: bytes) -> str:
     Returns:
         'html', 'xml', 또는 'bin'
     """
+    # PDF는 시그니처만으로 판별 (HTML 패턴 검사 생략)
+    if data.startswith(PDF_SIG):
+        return 'bin'
+    
     head = data[:READ_HEAD_N]
     
-    # BOM 제거 후 분석
-    if head.startswith(b'\xef\xbb\xbf'):  # UTF-8 BOM
-        head = head[3:]
-    elif head.startswith(b'\xff\xfe') or head.startswith(b'\xfe\xff'):  # UTF-16 BOM
-        head = head[2:]
+    # BOM 제거 후 분석 (대부분의 문서는 BOM이 없으므로 튜플 startswith 한 번으로 먼저 거름)
+    if head.startswith(_BOMS):
+        for bom in _BOMS:
+            if head.startswith(bom):
+                head = head[len(bom):]
+                break
     
-    # 앞 공백/주석 무시하고 실제 콘텐츠 시작점 찾기
-    stripped = head.lstrip()
+    # 앞 공백 무시하고 실제 콘텐츠 시작점 찾기 (lstrip으로 head 전체를 복사하지 않고 위치만 구함)
+    start = _LEADING_WS_RE.match(head).end()
     
-    # HTML 감지 (여러 패턴)
-    if (_HTML_TAG_RE.search(head) or 
-        _HTML_DOCTYPE_RE.search(head) or 
-        _META_ANY_RE.search(head) or 
-        _HEAD_RE.search(head)):
+    # 소문자 변환은 한 번만 하고 아래 검사들에서 재사용
+    lower_head = head.lower()
+    
+    # HTML 감지 (여러 패턴을 합친 정규식 1회 검색)
+    if _HTML_ANY_RE.search(lower_head):
         return 'html'
     
     # XML 선언 확인
-    if stripped.startswith(b'<?xml'):
+    if head.startswith(b'<?xml', start):
         return 'xml'
     
     # 선언 없는 XML 감지 (lxml 사용)
-    if HAS_LXML and stripped.startswith(b'<') and not stripped.startswith(b'<!'):
+    # 트리를 만들지 않고 앞부분만 pull 파서에 넣어 첫 시작 태그가 나오는지만 확인
+    if HAS_LXML and head.startswith(b'<', start) and not head.startswith(b'<!', start):
         try:
-            LxmlET.fromstring(data[:READ_HEAD_N * 2])
-            return 'xml'
-        except:
+            parser = LxmlET.XMLPullParser(events=('start',))
+            parser.feed(head[start:start + XML_SNIFF_HEAD_N])
+            if any(True for _ in parser.read_events()):
+                return 'xml'
+        except LxmlET.XMLSyntaxError:
             pass
     
     # 기타 XML 패턴 (휴리스틱)
-    if stripped.startswith(b'<') and b'</' in head:
+    if head.startswith(b'<', start) and b'</' in head:
         # 닫는 태그가 있고, HTML이 아니면 XML로 추정
-        if not any(tag in head.lower() for tag in [b'<html', b'<body', b'<head', b'<div', b'<span']):
+        if not any(tag in lower_head for tag in [b'<html', b'<body', b'<head', b'<div', b'<span']):
             return 'xml'
     
     return 'bin'
@@ -172,49 +243,71 @@ def sniff_kind(data: bytes) -> str:
 
 # ==================== 인코딩 감지 ====================
 
+def _detect_meta_charset_selectolax(head: bytes) -> Optional[str]:
+    """selectolax(Lexbor)로 <meta> 태그만 훑어 charset 추출 (트리 탐색 없이 CSS 셀렉터 사용)"""
+    # latin-1은 바이트를 그대로 문자로 옮기므로 태그 위치/속성 값이 보존됨
+    tree = LexborHTMLParser(head.decode('latin-1'))
+    
+    equiv_content = None
+    for meta in tree.css('meta'):
+        attrs = meta.attributes
+        
+        # <meta charset="..."> 가 http-equiv보다 우선
+        charset = attrs.get('charset')
+        if charset:
+            return _normalize_encoding_name(charset)
+        
+        # <meta http-equiv="Content-Type" content="...; charset=...">
+        if equiv_content is None and (attrs.get('http-equiv') or '').lower() == 'content-type':
+            equiv_content = attrs.get('content') or ''
+    
+    if equiv_content:
+        match = _CHARSET_IN_CONTENT_RE.search(equiv_content)
+        if match:
+            return _normalize_encoding_name(match.group(1))
+    return None
+
+
 def _detect_encoding_from_declaration(data: bytes, kind: str) -> Optional[str]:
     """콘텐츠 선언부에서 인코딩 감지"""
     
-    # BeautifulSoup으로 HTML charset 감지
-    if HAS_BS4 and kind == 'html':
+    # selectolax로 HTML charset 감지 (C 파서)
+    if HAS_SELECTOLAX and kind == 'html':
         try:
-            soup = BeautifulSoup(data[:READ_HEAD_N], 'html.parser')
-            
-            # <meta charset="...">
-            meta = soup.find('meta', charset=True)
-            if meta:
-                return _normalize_encoding_name(meta.get('charset'))
-            
-            # <meta http-equiv="Content-Type" content="...; charset=...">
-            meta = soup.find('meta', attrs={
-                'http-equiv': lambda x: x and x.lower() == 'content-type'
-            })
-            if meta:
-                content = meta.get('content', '')
-                match = re.search(r'charset=([^\s;]+)', content, re.I)
-                if match:
-                    return _normalize_encoding_name(match.group(1))
+            enc = _detect_meta_charset_selectolax(data[:READ_HEAD_N])
+            if enc:
+                return enc
         except Exception as e:
-            logging.debug(f"BS4 encoding detection failed: {e}")
+            logging.debug(f"selectolax encoding detection failed: {e}")
     
-    # 정규식 fallback
-    head = data[:READ_HEAD_N]
+    # 정규식 fallback (selectolax 미설치 또는 meta 태그에서 찾지 못한 경우)
+    # BeautifulSoup 트리 생성 없이 미리 컴파일된 bytes 정규식으로 동일한 선언을 찾음
     
-    # XML 선언
-    m = _XML_DECL_RE.search(head)
-    if m:
-        return _normalize_encoding_name(m.group(1).decode('ascii', 'ignore'))
+    # XML 선언 (문서 맨 앞에만 올 수 있으므로 64KB 전체를 검색하지 않음)
+    enc = _detect_xml_declared_encoding(data)
+    if enc:
+        return enc
+    
+    head = data[:READ_HEAD_N]
     
     # HTML meta charset
+    # (<meta http-equiv=... content="...; charset=..."> 도 charset= 부분이 매칭되므로 한 번 검색으로 충분)
     m = _HTML_META_TAG_RE.search(head)
     if m:
         return _normalize_encoding_name(m.group(1).decode('ascii', 'ignore'))
     
-    # HTML http-equiv
-    m = _HTML_HTTP_EQUIV_RE.search(head)
+    return None
+
+
+def _detect_xml_declared_encoding(data: bytes) -> Optional[str]:
+    """문서 맨 앞의 XML 선언(<?xml ... encoding=...?>)에서 인코딩 추출"""
+    head = data[:XML_DECL_HEAD_N]
+    if head.startswith(b'\xef\xbb\xbf'):  # UTF-8 BOM
+        head = head[3:]
+    
+    m = _XML_DECL_RE.match(head.lstrip())
     if m:
         return _normalize_encoding_name(m.group(1).decode('ascii', 'ignore'))
-    
     return None
 
 
@@ -224,8 +317,8 @@ def _detect_encoding_auto(data: bytes) -> Tuple[Optional[str], float]:
         return (None, 0.0)
     
     try:
-        # 더 많은 데이터로 감지 (정확도 향상)
-        result = chardet.detect(data[:READ_HEAD_N * 2])
+        # 앞부분 샘플만 사용 (순수 Python 감지기는 입력 크기에 비례해 느려짐)
+        result = chardet.detect(data[:CHARDET_SAMPLE_N])
         enc = result.get('encoding')
         conf = result.get('confidence', 0.0) or 0.0
         return (_normalize_encoding_name(enc), conf)
@@ -236,28 +329,23 @@ def _detect_encoding_auto(data: bytes) -> Tuple[Optional[str], float]:
 
 # ==================== 인코딩 변환 ====================
 
-def _build_encoding_candidates(declared: Optional[str], auto: Optional[str], auto_conf: float) -> List[str]:
+def _build_encoding_candidates(declared: Optional[str], auto: Optional[str], auto_conf: float) -> Tuple[str, ...]:
     """시도할 인코딩 목록 구성"""
-    candidates = []
-    
-    # 1. 선언된 인코딩 우선
-    if declared:
-        candidates.append(declared)
-    
-    # 2. 자동 감지 인코딩 (신뢰도 높으면)
-    if auto and auto_conf > 0.7 and auto not in candidates:
-        candidates.append(auto)
-    
-    # 3. 한국어 인코딩 우선순위
-    for enc in _KOREAN_ENCODING_PRIORITY:
-        if enc not in candidates:
-            candidates.append(enc)
-    
-    # 4. 자동 감지 인코딩 (신뢰도 낮아도)
-    if auto and auto not in candidates:
-        candidates.append(auto)
-    
-    return candidates
+    # 결과는 (선언 인코딩, 감지 인코딩, 신뢰도 기준 통과 여부)에만 의존하므로 캐시된 튜플을 재사용
+    return _encoding_candidates(declared, auto, auto_conf > 0.7)
+
+
+@functools.lru_cache(maxsize=64)
+def _encoding_candidates(declared: Optional[str], auto: Optional[str], auto_confident: bool) -> Tuple[str, ...]:
+    """_build_encoding_candidates의 캐시되는 구현"""
+    ordered = (
+        declared,                                  # 1. 선언된 인코딩 우선
+        auto if auto_confident else None,          # 2. 자동 감지 인코딩 (신뢰도 높으면)
+        *_KOREAN_ENCODING_PRIORITY,                # 3. 한국어 인코딩 우선순위
+        auto,                                      # 4. 자동 감지 인코딩 (신뢰도 낮아도)
+    )
+    # dict.fromkeys로 순서를 유지하며 중복 제거 (리스트 in 검사 반복 없음)
+    return tuple(dict.fromkeys(enc for enc in ordered if enc))
 
 
 def _to_utf8_with_rewrite(data: bytes, kind: str) -> Tuple[bytes, str]:
@@ -267,25 +355,56 @@ def _to_utf8_with_rewrite(data: bytes, kind: str) -> Tuple[bytes, str]:
     Returns:
         (UTF-8 바이트, 사용된 인코딩)
     """
-    # 인코딩 감지
-    declared_enc = _detect_encoding_from_declaration(data, kind)
-    auto_enc, auto_conf = _detect_encoding_auto(data)
+    # UTF-8 빠른 경로: 대부분의 최신 공시는 이미 UTF-8이므로 먼저 검증하고,
+    # 유효하면 인코딩 감지/후보 시도 없이 선언부만 교체 (재인코딩 없음)
+    bom = data.startswith(codecs.BOM_UTF8)
+    body = data[len(codecs.BOM_UTF8):] if bom else data
+    try:
+        # 순수 ASCII는 그 자체로 유효한 UTF-8이므로 str 생성 없이 isascii()로만 확인
+        if not body.isascii():
+            body.decode('utf-8', errors='strict')
+        return (_rewrite_encoding_declaration(body, kind), 'utf-8-sig' if bom else 'utf-8')
+    except UnicodeDecodeError:
+        pass
+    
+    # UTF-16/32 BOM이 있으면 선언부 검색 없이 인코딩 확정
+    declared_enc = next((enc for bom, enc in _BOM_ENCODINGS if data.startswith(bom)), None)
+    
+    # 인코딩 감지 (XML 선언이 맨 앞에 있으면 선언부 전체 검색도 생략)
+    if not declared_enc and kind == 'xml':
+        declared_enc = _detect_xml_declared_encoding(data)
+    if not declared_enc:
+        declared_enc = _detect_encoding_from_declaration(data, kind)
+    
+    # 선언된 인코딩이 있으면 자동 감지 생략
+    # (선언이 틀린 경우에도 한국어 인코딩 우선순위 후보로 복구됨)
+    if declared_enc:
+        auto_enc, auto_conf = (None, 0.0)
+    else:
+        auto_enc, auto_conf = _detect_encoding_auto(data)
     
     candidates = _build_encoding_candidates(declared_enc, auto_enc, auto_conf)
     
     # 순차적으로 시도
     for enc in candidates:
+        # UTF-8 계열은 위 빠른 경로에서 이미 유효하지 않음이 확인됨
+        if enc in _UTF8_COMPATIBLE:
+            continue
+        
         try:
+            # 앞부분만 먼저 디코딩해 보고, 실패하는 후보는 전체 디코딩 없이 건너뜀
+            # (증분 디코더는 잘린 멀티바이트 문자를 오류로 보지 않음)
+            if len(data) > ENCODING_PROBE_N:
+                codecs.getincrementaldecoder(enc)('strict').decode(data[:ENCODING_PROBE_N])
+            
             # 엄격한 디코딩/인코딩
+            # (str.encode('utf-8')의 결과는 항상 유효한 UTF-8이므로 별도 재검증 없음)
             txt = data.decode(enc, errors='strict')
             utf8_bytes = txt.encode('utf-8', errors='strict')
             
             # 선언부 재작성
             utf8_bytes = _rewrite_encoding_declaration(utf8_bytes, kind)
             
-            # 검증
-            utf8_bytes.decode('utf-8', errors='strict')
-            
             return (utf8_bytes, enc)
             
         except (UnicodeDecodeError, UnicodeEncodeError):
@@ -319,47 +438,49 @@ def _rewrite_encoding_declaration(data: bytes, kind: str) -> bytes:
 
 
 def _rewrite_html_encoding(data: bytes) -> bytes:
-    """HTML charset 선언을 UTF-8로 수정"""
-    
-    had_charset = False
-    
-    # charset 속성 치환
-    if _HTML_META_TAG_RE.search(data):
-        had_charset = True
-        data = _HTML_META_TAG_RE.sub(b'<meta charset="UTF-8">', data, count=0)
-    
-    # http-equiv 방식 치환
-    if _HTML_HTTP_EQUIV_RE.search(data):
-        had_charset = True
-        data = _HTML_HTTP_EQUIV_RE.sub(b'<meta charset="UTF-8">', data, count=0)
+    """
+    HTML charset 선언을 UTF-8로 수정.
     
-    # charset 선언이 없으면 추가
-    if not had_charset:
-        m = _HEAD_RE.search(data)
+    브라우저는 문서 앞부분에서만 charset 선언을 찾으므로 앞 READ_HEAD_N 바이트만
+    치환하고, 나머지 본문은 memoryview로 넘겨 결과를 만들 때 한 번만 복사한다.
+    """
+    if len(data) <= READ_HEAD_N:
+        head, rest = data, None
+    else:
+        head, rest = data[:READ_HEAD_N], memoryview(data)[READ_HEAD_N:]
+    
+    # charset 선언 태그 치환 (subn으로 검색과 치환을 한 번에 수행)
+    # http-equiv 방식도 content의 charset= 부분으로 함께 매칭되므로 한 번의 패스로 충분하고,
+    # 태그를 닫는 '>'까지 통째로 바꿔 기존 속성 잔여물(예: '">')이 남지 않게 함
+    head, n_meta = _HTML_META_CHARSET_TAG_RE.subn(b'<meta charset="UTF-8">', head)
+    
+    # charset 선언이 없으면 <head> 또는 doctype 뒤(둘 다 없으면 맨 앞)에 추가
+    # 삽입 위치 앞뒤는 memoryview 조각으로 넘겨 마지막 join에서 한 번만 복사
+    parts = [head]
+    if not n_meta:
+        m = _HEAD_RE.search(head) or _DOCTYPE_RE.search(head)
         if m:
-            data = data[:m.end()] + b'\n<meta charset="UTF-8">' + data[m.end():]
+            view = memoryview(head)
+            parts = [view[:m.end()], b'\n<meta charset="UTF-8">', view[m.end():]]
         else:
-            m2 = _DOCTYPE_RE.search(data)
-            if m2:
-                data = data[:m2.end()] + b'\n<meta charset="UTF-8">' + data[m2.end():]
-            else:
-                data = b'<meta charset="UTF-8">\n' + data
+            parts = [b'<meta charset="UTF-8">\n', head]
     
-    # 중복 meta charset 제거
-    data = re.sub(rb'(?is)(<meta\s+charset="UTF-8">\s*){2,}', b'<meta charset="UTF-8">', data)
+    # 중복 meta charset 제거 (선언이 둘 이상 치환된 경우에만 중복이 생길 수 있음)
+    elif n_meta > 1:
+        parts = [_DUP_META_CHARSET_RE.sub(b'<meta charset="UTF-8">', head)]
     
-    return data
+    if rest is not None:
+        parts.append(rest)
+    return parts[0] if len(parts) == 1 else b''.join(parts)
 
 
 def _rewrite_xml_encoding(data: bytes) -> bytes:
     """XML 선언의 encoding을 UTF-8로 수정"""
     
-    if _XML_DECL_REPL.search(data):
-        return _XML_DECL_REPL.sub(
-            b'<?xml version="1.0" encoding="UTF-8"?>',
-            data,
-            count=1
-        )
+    # 선언은 문서 맨 앞에만 올 수 있으므로 match로 확인하고 나머지 본문은 그대로 이어붙임
+    m = _XML_DECL_REPL.match(data)
+    if m:
+        return b''.join((b'<?xml version="1.0" encoding="UTF-8"?>', memoryview(data)[m.end():]))
     else:
         # XML 선언이 없으면 추가
         return b'<?xml version="1.0" encoding="UTF-8"?>\n' + data
@@ -385,8 +506,8 @@ def _fix_zip_filename_encoding(info) -> str:
     """ZIP 내 파일명 인코딩 교정 (한글 깨짐 방지)"""
     name = info.filename
     
-    # UTF-8 플래그가 없으면 CP437 → CP949 변환 시도
-    if not (info.flag_bits & 0x800):
+    # UTF-8 플래그가 없으면 CP437 → CP949 변환 시도 (ASCII 파일명은 변환 결과가 같으므로 생략)
+    if not (info.flag_bits & 0x800) and not name.isascii():
         try:
             name = name.encode('cp437').decode('cp949', errors='ignore')
         except Exception:
@@ -395,55 +516,141 @@ def _fix_zip_filename_encoding(info) -> str:
     return _normalize_filename(name)
 
 
-def _classify_member(zf: ZipFile, info) -> Tuple[str, bytes, str]:
-    """ZIP 멤버 종류 판별 및 데이터 반환"""
+def _classify_member(zf: ZipFile, info: ZipInfo) -> Tuple[str, ZipInfo, str]:
+    """
+    ZIP 멤버 종류 판별.
+    
+    sniff_kind가 보는 앞부분(READ_HEAD_N)만 압축 해제하고,
+    전체 데이터는 최종 선택된 멤버에 대해서만 읽는다.
+    확장자로 바이너리임이 분명한 첨부 파일은 압축 해제 없이 'bin'으로 분류한다.
+    """
     name = _fix_zip_filename_encoding(info)
-    data = zf.read(info)
-    kind = sniff_kind(data)
-    return (kind, data, name)
+    if os.path.splitext(name)[1].lower() in BINARY_EXTENSIONS:
+        return ('bin', info, name)
+    
+    with zf.open(info) as fh:
+        head = fh.read(READ_HEAD_N)
+    kind = sniff_kind(head)
+    return (kind, info, name)
 
 
-def _pick_best(members: List[Tuple[str, bytes, str]]) -> Tuple[str, bytes, str]:
-    """ZIP 멤버 중 최적 파일 선택 (종류 우선순위 > 크기)"""
-    def sort_key(m):
-        kind, data, name = m
-        kind_priority = KIND_PRIORITY.index(kind) if kind in KIND_PRIORITY else len(KIND_PRIORITY)
-        return (kind_priority, -len(data))
+def _pick_best(zf: ZipFile, infos: List[ZipInfo]) -> Tuple[str, ZipInfo, str]:
+    """
+    ZIP 멤버 중 최적 파일 선택 (종류 우선순위 > 크기).
     
-    members.sort(key=sort_key)
-    return members[0]
+    큰 멤버부터 판별하므로 처음 발견한 최우선 종류(html)가 곧 최종 선택이 되고,
+    그보다 작은 나머지 멤버는 압축 해제하지 않는다.
+    """
+    best: Dict[str, Tuple[str, ZipInfo, str]] = {}
+    for info in sorted(infos, key=lambda i: -i.file_size):
+        member = _classify_member(zf, info)
+        if member[0] == KIND_PRIORITY[0]:
+            return member
+        best.setdefault(member[0], member)
+    
+    for kind in KIND_PRIORITY:
+        if kind in best:
+            return best[kind]
+    return next(iter(best.values()))
+
+
+def _read_single_member(zip_bytes: bytes) -> Optional[Tuple[ZipInfo, bytes]]:
+    """
+    단일 멤버 ZIP 빠른 경로.
+    
+    첫 로컬 헤더의 데이터 바로 뒤에 central directory가 시작하면 멤버가 하나뿐이므로
+    ZipFile 없이 zlib로 직접 압축 해제한다. 조건이 하나라도 맞지 않으면 None을
+    반환하여 ZipFile 경로로 처리한다.
+    """
+    if len(zip_bytes) < _ZIP_LOCAL_HEADER.size:
+        return None
+    
+    sig, _, flags, method, _, _, crc, csize, usize, nlen, xlen = _ZIP_LOCAL_HEADER.unpack_from(zip_bytes)
+    
+    # 암호화(bit 0), data descriptor(bit 3), ZIP64, 미지원 압축 방식은 제외
+    if sig != _ZIP_LOCAL_HEADER_SIG or flags & 0x09 or method not in (0, 8):
+        return None
+    if 0xFFFFFFFF in (csize, usize) or usize > MAX_TOTAL_UNCOMPRESSED:
+        return None
+    
+    start = _ZIP_LOCAL_HEADER.size + nlen + xlen
+    end = start + csize
+    if zip_bytes[end:end + 4] != _ZIP_CENTRAL_DIR_SIG:
+        return None
+    
+    try:
+        name = zip_bytes[_ZIP_LOCAL_HEADER.size:_ZIP_LOCAL_HEADER.size + nlen].decode(
+            'utf-8' if flags & 0x800 else 'cp437'
+        )
+    except UnicodeDecodeError:
+        return None
+    if not name or name.endswith('/'):
+        return None
+    
+    body = memoryview(zip_bytes)[start:end]
+    try:
+        data = zlib.decompress(body, -zlib.MAX_WBITS, usize or 1) if method == 8 else bytes(body)
+    except zlib.error:
+        return None
+    
+    if len(data) != usize or _crc32(data) != crc:
+        return None
+    
+    info = ZipInfo(name)
+    info.flag_bits = flags
+    return (info, data)
 
 
 def _normalize_zip(base_name: str, zip_bytes: bytes) -> Tuple[str, bytes, str, str]:
     """ZIP 파일 처리 및 정규화"""
     try:
-        with ZipFile(BytesIO(zip_bytes)) as zf:
-            infos = _safe_zip_members(zf)
-            
-            if not infos:
-                raise ValueError("Empty ZIP file")
-            
-            # 모든 멤버 분류
-            classified = [_classify_member(zf, i) for i in infos]
-            
-            # 최적 멤버 선택
-            kind, data, picked_name = _pick_best(classified)
-            
-            summary = f"ZIP({len(infos)} files) -> '{picked_name}' ({kind})"
-            
-            # UTF-8 변환
-            if kind == 'html':
-                utf8_data, used_enc = _to_utf8_with_rewrite(data, 'html')
-                summary += f" [enc: {used_enc}]"
-                return ('text/html; charset=UTF-8', utf8_data, f'{base_name}.html', summary)
-            
-            if kind == 'xml':
-                utf8_data, used_enc = _to_utf8_with_rewrite(data, 'xml')
-                summary += f" [enc: {used_enc}]"
-                return ('application/xml; charset=UTF-8', utf8_data, f'{base_name}.xml', summary)
-            
-            # 바이너리는 그대로
-            return ('application/octet-stream', data, base_name, summary)
+        single = _read_single_member(zip_bytes)
+        
+        if single:
+            # 단일 멤버: central directory 파싱 없이 바로 사용
+            info, data = single
+            picked_name = _fix_zip_filename_encoding(info)
+            kind = sniff_kind(data)
+            n_files = 1
+        else:
+            # BytesIO(bytes)는 쓰기 전까지 원본 버퍼를 공유하므로 ZIP 전체가 복사되지 않음
+            with ZipFile(BytesIO(zip_bytes)) as zf:
+                infos = _safe_zip_members(zf)
+                
+                if not infos:
+                    raise ValueError("Empty ZIP file")
+                
+                # 마크업 확장자 멤버가 있으면 그 멤버들만 분류하고, 없을 때만 전체 멤버 분류
+                # (종류는 확장자가 아닌 내용으로 판별)
+                markup = [i for i in infos if i.filename.lower().endswith(MARKUP_EXTENSIONS)]
+                candidates = markup or infos
+                
+                if len(candidates) == 1:
+                    # 후보가 하나면 어차피 선택되므로 앞부분 판별 없이 한 번만 압축 해제
+                    info = candidates[0]
+                    data = zf.read(info)
+                    kind, picked_name = sniff_kind(data), _fix_zip_filename_encoding(info)
+                else:
+                    # 최적 멤버 선택 후 해당 멤버만 전체 압축 해제
+                    kind, info, picked_name = _pick_best(zf, candidates)
+                    data = zf.read(info)
+                n_files = len(infos)
+        
+        summary = f"ZIP({n_files} files) -> '{picked_name}' ({kind})"
+        
+        # UTF-8 변환
+        if kind == 'html':
+            utf8_data, used_enc = _to_utf8_with_rewrite(data, 'html')
+            summary += f" [enc: {used_enc}]"
+            return ('text/html; charset=UTF-8', utf8_data, f'{base_name}.html', summary)
+        
+        if kind == 'xml':
+            utf8_data, used_enc = _to_utf8_with_rewrite(data, 'xml')
+            summary += f" [enc: {used_enc}]"
+            return ('application/xml; charset=UTF-8', utf8_data, f'{base_name}.xml', summary)
+        
+        # 바이너리는 그대로
+        return ('application/octet-stream', data, base_name, summary)
             
     except (BadZipFile, ValueError) as e:
         logging.warning(f"ZIP processing failed: {e}")
@@ -469,12 +676,13 @@ def normalize_payload(
         (content_type, normalized_bytes, filename)
     """
     base_name = _safe_ascii_name(_get_base_name(object_key))
-    kind = sniff_kind(body)
-    final_summary = f"Detected as '{kind}'"
     
-    # ZIP 시그니처가 있으면 종류를 'zip'으로 확정
-    if body.startswith(ZIP_SIG):
+    # ZIP 시그니처가 있으면 종류를 'zip'으로 확정 (HTML/XML 패턴 검사 생략)
+    if body.startswith(ZIP_SIGS):
         kind = 'zip'
+    else:
+        kind = sniff_kind(body)
+    final_summary = f"Detected as '{kind}'"
     
     # 파일 종류에 따라 처리
     if kind == 'zip':
@@ -498,8 +706,8 @@ def normalize_payload(
         norm_bytes = body
         final_name = base_name
     
-    # 로깅
-    if log_context:
+    # 로깅 (INFO가 꺼져 있으면 긴 메시지 문자열을 만들지 않음)
+    if log_context and logging.getLogger().isEnabledFor(logging.INFO):
         polling_date = log_context.get('polling_date', '-')
         rcept_date = log_context.get('rcept_dt', '-')
         date_info = rcept_date
@@ -524,13 +732,21 @@ def get_library_status() -> Dict[str, bool]:
     """사용 가능한 라이브러리 상태 반환"""
     return {
         'chardet': HAS_CHARDET,
-        'beautifulsoup4': HAS_BS4,
+        'cchardet': HAS_CCHARDET,
+        'selectolax': HAS_SELECTOLAX,
         'lxml': HAS_LXML,
+        'isal': HAS_ISAL,
     }
 
 
 def validate_utf8(data: bytes) -> bool:
-    """UTF-8 유효성 검증"""
+    """
+    UTF-8 유효성 검증.
+    
+    전체 버퍼를 한 번 더 디코딩하므로 진단/테스트용으로만 사용한다.
+    normalize_payload의 결과는 str.encode('utf-8') 또는 검증된 원본에서 만들어지므로
+    처리 경로에서 다시 검증할 필요가 없다.
+    """
     try:
         data.decode('utf-8', errors='strict')
         return True
@@ -1,12 +1,26 @@
+import re
+import time
 import logging
+import threading
 import xml.etree.ElementTree as ET
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Deque, Dict, Any, Optional, List
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:                                    # orjson: C 구현 JSON 파싱 (선택적)
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+logger = logging.getLogger(__name__)
+
 
 class DartApiStatus:
     """
@@ -47,6 +61,46 @@ class DartApiError(Exception):
         super().__init__(f"DART API Error [{status_code}]: {message}")
 
 
+class DartApiCancelledError(Exception):
+    """종료 신호로 요청 수 제한 대기가 중단되어 요청을 보내지 않은 경우"""
+
+
+class _RateLimiter:
+    """
+    슬라이딩 윈도우 방식의 요청 수 제한기.
+    
+    최근 period초 동안 보낸 요청이 max_calls개에 도달하면 가장 오래된
+    요청이 윈도우를 벗어날 때까지 대기한다. 여러 워커 스레드가 공유한다.
+    대기는 stop_event로 깨울 수 있어 종료 신호 시 최대 period초 지연되지 않는다.
+    """
+    
+    def __init__(self, max_calls: int, period: float = 60.0, stop_event: Optional[threading.Event] = None):
+        self._max_calls = max_calls
+        self._period = period
+        self._calls: Deque[float] = deque()
+        self._lock = threading.Lock()
+        self._stop_event = stop_event or threading.Event()
+    
+    def acquire(self) -> bool:
+        """
+        요청 한 건을 보낼 수 있을 때까지 대기.
+        
+        Returns:
+            bool: True면 요청 가능, False면 대기 중 종료 신호 수신
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self._period:
+                    self._calls.popleft()
+                if len(self._calls) < self._max_calls:
+                    self._calls.append(now)
+                    return True
+                wait = self._period - (now - self._calls[0])
+            if self._stop_event.wait(wait):
+                return False
+
+
 class DartApiClient:
     """
     DART Open API와 안정적으로 통신하기 위한 클라이언트 클래스.
@@ -54,6 +108,7 @@ class DartApiClient:
     기능:
     - 공시 목록 조회 (list.json)
     - 공시 원문 파일 다운로드 (document.xml)
+    - 오늘 공시 RSS 피드 변경 감지 (todayRSS.xml)
     - 자동 재시도 (exponential backoff)
     - 에러 코드별 처리
     
@@ -63,24 +118,47 @@ class DartApiClient:
     """
     
     _BASE_URL = "https://opendart.fss.or.kr/api"
+    _RSS_URL = "https://dart.fss.or.kr/api/todayRSS.xml"
     _ZIP_SIGNATURE = b'PK\x03\x04'
+    _RCPNO_RE = re.compile(r'rcpNo=(\d{14})')
+    # 에러 응답(약 200바이트)의 status/message만 읽는 빠른 경로 (엔티티가 있으면 XML 파서로 위임)
+    _ERR_RE = re.compile(rb'<status>([^<]{1,8})</status>\s*<message>([^<&]*)</message>')
+    _ERR_SEARCH_N = 1024
+    # 에러 응답이 아닌 큰 본문이나 엔티티 선언(DOCTYPE)이 있는 응답은 XML 파서에 넘기지 않음
+    _ERR_PARSE_MAX_N = 64 * 1024
 
-    def __init__(self, api_key: str, timeout: int = 30):
+    def __init__(
+        self,
+        api_key: str,
+        timeout: int = 30,
+        rate_limit_per_minute: int = 900,
+        stop_event: Optional[threading.Event] = None,
+    ):
         """
         클라이언트 초기화.
         
         Args:
             api_key: DART Open API 인증키 (40자 영숫자)
             timeout: 요청 타임아웃 (초)
+            rate_limit_per_minute: Open API 분당 최대 요청 수 (서비스 제한 전에 클라이언트에서 대기)
+            stop_event: 설정되면 요청 수 제한 대기를 중단하는 종료 이벤트
         """
         if not api_key or len(api_key) != 40:
-            logging.warning(f"API key length is {len(api_key) if api_key else 0}, expected 40")
+            logger.warning(f"API key length is {len(api_key) if api_key else 0}, expected 40")
         
         self.api_key = api_key
         self.timeout = timeout
         self.session = requests.Session()
+        # 목록/원문 조회가 워커 스레드 간에 공유하는 분당 요청 제한 (RSS는 별도 호스트라 제외)
+        self._rate_limiter = _RateLimiter(rate_limit_per_minute, stop_event=stop_event)
+        
+        # RSS 조건부 GET 상태 (ETag / Last-Modified / 마지막으로 본 pubDate)
+        self._rss_etag: Optional[str] = None
+        self._rss_last_modified: Optional[str] = None
+        self._rss_high_water: Optional[datetime] = None
         
         # 재시도 전략 설정 (HTTP 레벨)
+        # 워커들이 동시에 재시도하지 않도록 백오프에 지터를 더하고, Retry-After 헤더가 있으면 그 값을 우선함
         retry = Retry(
             total=5,
             read=5,
@@ -88,9 +166,16 @@ class DartApiClient:
             status=5,
             status_forcelist=[429, 500, 502, 503, 504],
             backoff_factor=1.2,
+            backoff_max=30,
+            backoff_jitter=1.0,
             respect_retry_after_header=True,
         )
-        adapter = HTTPAdapter(max_retries=retry)
+        # 연결 풀: 같은 호스트에 대한 keep-alive 연결을 재사용해 TLS 핸드셰이크 반복을 피함
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=retry,
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
@@ -117,6 +202,9 @@ class DartApiClient:
         Returns:
             API 응답 딕셔너리 또는 None (네트워크 오류 시)
             
+        Raises:
+            DartApiCancelledError: 요청 수 제한 대기 중 종료 신호 수신 시
+            
         Note:
             corp_code 없이 조회 시 최대 3개월 기간 제한 적용
         """
@@ -137,16 +225,22 @@ class DartApiClient:
         if pblntf_ty:
             params["pblntf_ty"] = pblntf_ty
         
+        if not self._rate_limiter.acquire():
+            raise DartApiCancelledError("Shutdown requested while waiting for rate limit")
+        
         try:
             response = self.session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
+            # list.json은 UTF-8 고정이므로 텍스트 디코딩 없이 바이트를 바로 파싱
+            if HAS_ORJSON:
+                return orjson.loads(response.content)
             return response.json()
             
         except requests.exceptions.RequestException as e:
-            logging.error(f"Failed to fetch disclosures from DART API: {e}")
+            logger.error(f"Failed to fetch disclosures from DART API: {e}")
             return None
         except ValueError as e:
-            logging.error(f"Failed to decode JSON response from disclosures API: {e}")
+            logger.error(f"Failed to decode JSON response from disclosures API: {e}")
             return None
 
     def fetch_document_content(self, rcept_no: str) -> Optional[bytes]:
@@ -161,6 +255,7 @@ class DartApiClient:
             
         Raises:
             DartApiError: API 레벨 에러 발생 시 (선택적으로 처리 가능)
+            DartApiCancelledError: 요청 수 제한 대기 중 종료 신호 수신 시
             
         Note:
             - 성공 시 Content-Type: application/zip
@@ -169,6 +264,9 @@ class DartApiClient:
         url = f"{self._BASE_URL}/document.xml"
         params = {"crtfc_key": self.api_key, "rcept_no": rcept_no}
         
+        if not self._rate_limiter.acquire():
+            raise DartApiCancelledError("Shutdown requested while waiting for rate limit")
+        
         try:
             response = self.session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
@@ -182,7 +280,7 @@ class DartApiClient:
             error_info = self._parse_xml_error(content_bytes)
             if error_info:
                 status_code, message = error_info
-                logging.warning(
+                logger.warning(
                     f"DART document API error for rcept_no={rcept_no}: "
                     f"status={status_code}, message={message}"
                 )
@@ -198,8 +296,73 @@ class DartApiClient:
             return None
 
         except requests.exceptions.RequestException as e:
-            logging.error(f"Request to fetch document {rcept_no} failed: {e}")
+            logger.error(f"Request to fetch document {rcept_no} failed: {e}")
+            return None
+    
+    def fetch_rss_updates(self) -> Optional[List[str]]:
+        """
+        오늘 공시 RSS 피드에서 마지막 확인 이후 새로 게시된 접수번호를 조회.
+        
+        ETag / Last-Modified 기반 조건부 GET을 사용하므로
+        피드가 바뀌지 않았으면 304 응답으로 본문 없이 끝난다.
+        
+        Returns:
+            새 접수번호 목록 (변경 없으면 빈 리스트) 또는 None (피드 조회 실패 시)
+        """
+        headers = {}
+        if self._rss_etag:
+            headers["If-None-Match"] = self._rss_etag
+        if self._rss_last_modified:
+            headers["If-Modified-Since"] = self._rss_last_modified
+        
+        try:
+            response = self.session.get(self._RSS_URL, headers=headers, timeout=self.timeout)
+            if response.status_code == 304:
+                return []
+            response.raise_for_status()
+            root = ET.fromstring(response.content)
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Failed to fetch DART RSS feed: {e}")
+            return None
+        except ET.ParseError as e:
+            logger.warning(f"Failed to parse DART RSS feed: {e}")
+            return None
+        
+        self._rss_etag = response.headers.get("ETag")
+        self._rss_last_modified = response.headers.get("Last-Modified")
+        
+        high_water = self._rss_high_water
+        newest = high_water
+        rcept_nos = []
+        
+        for item in root.iter("item"):
+            pub_date = self._parse_pub_date(item.findtext("pubDate"))
+            
+            # 같은 초에 게시된 항목을 놓치지 않도록 경계값은 포함 (중복은 호출 측에서 제거)
+            if high_water and pub_date and pub_date < high_water:
+                continue
+            
+            match = self._RCPNO_RE.search(item.findtext("link") or item.findtext("guid") or "")
+            if match:
+                rcept_nos.append(match.group(1))
+            
+            if pub_date and (newest is None or pub_date > newest):
+                newest = pub_date
+        
+        self._rss_high_water = newest
+        return rcept_nos
+    
+    @staticmethod
+    def _parse_pub_date(value: Optional[str]) -> Optional[datetime]:
+        """RSS pubDate(RFC 822)를 datetime으로 변환"""
+        if not value:
+            return None
+        try:
+            parsed = parsedate_to_datetime(value.strip())
+        except (TypeError, ValueError):
             return None
+        # 시간대 정보가 없으면 UTC로 간주 (aware/naive 비교 오류 방지)
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
     
     def _parse_xml_error(self, content: bytes) -> Optional[tuple]:
         """
@@ -215,6 +378,17 @@ class DartApiClient:
         Returns:
             (status_code, message) 튜플 또는 None
         """
+        # 고정 형식의 에러 응답은 트리를 만들지 않고 앞부분에서 바로 추출
+        match = self._ERR_RE.search(content, 0, self._ERR_SEARCH_N)
+        if match:
+            return (
+                match.group(1).decode('utf-8', 'replace'),
+                match.group(2).decode('utf-8', 'replace'),
+            )
+        
+        if len(content) > self._ERR_PARSE_MAX_N or b'<!DOCTYPE' in content:
+            return None
+        
         try:
             # XML 파싱 시도
             root = ET.fromstring(content)
@@ -230,7 +404,7 @@ class DartApiClient:
             # XML이 아닌 경우 무시
             pass
         except Exception as e:
-            logging.debug(f"Failed to parse XML error response: {e}")
+            logger.debug(f"Failed to parse XML error response: {e}")
             
         return None
     
@@ -18,7 +18,7 @@ logger = logging.getLogger(__name__)
 
 
 # 샘플 회사 데이터
-SAMPLE_COMPANIES = [
+SAMPLE_COMPANIES = (
     {"corp_code": "00126380", "corp_name": "삼성전자", "stock_code": "005930", "corp_cls": "Y"},
     {"corp_code": "00164742", "corp_name": "SK하이닉스", "stock_code": "000660", "corp_cls": "Y"},
     {"corp_code": "00356370", "corp_name": "네이버", "stock_code": "035420", "corp_cls": "Y"},
@@ -29,10 +29,10 @@ SAMPLE_COMPANIES = [
     {"corp_code": "00155319", "corp_name": "기아", "stock_code": "000270", "corp_cls": "Y"},
     {"corp_code": "00126186", "corp_name": "포스코홀딩스", "stock_code": "005490", "corp_cls": "Y"},
     {"corp_code": "00547583", "corp_name": "삼성바이오로직스", "stock_code": "207940", "corp_cls": "Y"},
-]
+)
 
 # 샘플 보고서 유형
-SAMPLE_REPORT_TYPES = [
+SAMPLE_REPORT_TYPES = (
     "사업보고서",
     "반기보고서", 
     "분기보고서",
@@ -45,10 +45,40 @@ SAMPLE_REPORT_TYPES = [
     "유상증자결정",
     "무상증자결정",
     "전환사채권발행결정",
-]
+)
 
 # 샘플 비고
-SAMPLE_REMARKS = ["", "유", "코", "채", "넥", "공", "연", "정", "철"]
+SAMPLE_REMARKS = ("", "유", "코", "채", "넥", "공", "연", "정", "철")
+
+# 가짜 공시 문서 템플릿 (접수번호, 생성일시, 재무정보 3개 항목을 %b로 치환)
+_MOCK_DOCUMENT_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <title>공시 문서 - %b</title>
+</head>
+<body>
+    <h1>공시 문서</h1>
+    <p>접수번호: %b</p>
+    <p>생성일시: %b</p>
+    <hr>
+    <h2>본문</h2>
+    <p>이 문서는 테스트를 위해 자동 생성된 Mock 데이터입니다.</p>
+    <p>실제 DART API 연동 시에는 실제 공시 문서가 표시됩니다.</p>
+    <hr>
+    <h2>재무정보 (샘플)</h2>
+    <table border="1">
+        <tr><th>항목</th><th>금액</th></tr>
+        <tr><td>자산총계</td><td>%b억원</td></tr>
+        <tr><td>매출액</td><td>%b억원</td></tr>
+        <tr><td>영업이익</td><td>%b억원</td></tr>
+    </table>
+    <hr>
+    <footer>
+        <p>🧪 이 문서는 MOCK_MODE에서 생성되었습니다.</p>
+    </footer>
+</body>
+</html>""".encode('utf-8')
 
 
 class MockDartApiClient:
@@ -69,18 +99,18 @@ class MockDartApiClient:
         """
         self.api_key = api_key
         self.timeout = timeout
-        self._generated_rcept_nos = set()
+        # 날짜별 접수번호 순번 (재시작 시 저장소의 기존 객체와 겹치지 않도록 시작값은 무작위)
+        self._seq_by_date: Dict[str, int] = {}
         logger.info("🧪 MockDartApiClient initialized - using fake data")
     
     def _generate_rcept_no(self, date_str: str) -> str:
         """고유한 접수번호 생성"""
-        while True:
-            # 형식: YYYYMMDD + 6자리 순번
-            seq = random.randint(100000, 999999)
-            rcept_no = f"{date_str}{seq}"
-            if rcept_no not in self._generated_rcept_nos:
-                self._generated_rcept_nos.add(rcept_no)
-                return rcept_no
+        # 형식: YYYYMMDD + 6자리 순번 (날짜별 단조 증가로 중복 확인 없이 고유성 보장)
+        seq = self._seq_by_date.get(date_str)
+        if seq is None:
+            seq = random.randint(100000, 499999)
+        self._seq_by_date[date_str] = seq + 1
+        return f"{date_str}{seq:06d}"
 
     def fetch_disclosures(
         self,
@@ -110,7 +140,16 @@ class MockDartApiClient:
         실제 DartApiClient와 동일한 인터페이스.
         """
         return self.download_document(rcept_no)
-    
+
+    def fetch_rss_updates(self) -> Optional[List[str]]:
+        """
+        실제 DartApiClient와 동일한 인터페이스.
+
+        Mock 모드에는 RSS 피드가 없으므로 항상 None을 반환해
+        호출 측이 주기적 폴링으로 동작하도록 한다.
+        """
+        return None
+
     def fetch_disclosure_list(self, target_date: str) -> List[Dict[str, Any]]:
         """
         가짜 공시 목록 생성.
@@ -130,11 +169,12 @@ class MockDartApiClient:
         num_disclosures = random.randint(3, 8)
         disclosures = []
         
-        for _ in range(num_disclosures):
-            company = random.choice(SAMPLE_COMPANIES)
-            report_type = random.choice(SAMPLE_REPORT_TYPES)
-            remark = random.choice(SAMPLE_REMARKS)
-            
+        # 항목별 무작위 선택을 한 번에 뽑음
+        companies = random.choices(SAMPLE_COMPANIES, k=num_disclosures)
+        report_types = random.choices(SAMPLE_REPORT_TYPES, k=num_disclosures)
+        remarks = random.choices(SAMPLE_REMARKS, k=num_disclosures)
+        
+        for company, report_type, remark in zip(companies, report_types, remarks):
             disclosure = {
                 "corp_code": company["corp_code"],
                 "corp_name": company["corp_name"],
@@ -166,45 +206,25 @@ class MockDartApiClient:
         # 시뮬레이션 딜레이
         time.sleep(0.3)
         
-        # 가짜 HTML 문서 생성
-        html_content = f"""<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <title>공시 문서 - {rcept_no}</title>
-</head>
-<body>
-    <h1>공시 문서</h1>
-    <p>접수번호: {rcept_no}</p>
-    <p>생성일시: {datetime.now().isoformat()}</p>
-    <hr>
-    <h2>본문</h2>
-    <p>이 문서는 테스트를 위해 자동 생성된 Mock 데이터입니다.</p>
-    <p>실제 DART API 연동 시에는 실제 공시 문서가 표시됩니다.</p>
-    <hr>
-    <h2>재무정보 (샘플)</h2>
-    <table border="1">
-        <tr><th>항목</th><th>금액</th></tr>
-        <tr><td>자산총계</td><td>{random.randint(1000, 9999):,}억원</td></tr>
-        <tr><td>매출액</td><td>{random.randint(100, 999):,}억원</td></tr>
-        <tr><td>영업이익</td><td>{random.randint(10, 99):,}억원</td></tr>
-    </table>
-    <hr>
-    <footer>
-        <p>🧪 이 문서는 MOCK_MODE에서 생성되었습니다.</p>
-    </footer>
-</body>
-</html>"""
-        
-        return html_content.encode('utf-8')
+        # 가짜 HTML 문서 생성 (고정 부분은 미리 인코딩된 템플릿 사용)
+        rcept_no_bytes = rcept_no.encode('utf-8')
+        return _MOCK_DOCUMENT_TEMPLATE % (
+            rcept_no_bytes,
+            rcept_no_bytes,
+            datetime.now().isoformat().encode('ascii'),
+            f"{random.randint(1000, 9999):,}".encode('ascii'),
+            f"{random.randint(100, 999):,}".encode('ascii'),
+            f"{random.randint(10, 99):,}".encode('ascii'),
+        )
 
 
-def get_dart_client(config):
+def get_dart_client(config, stop_event=None):
     """
     설정에 따라 적절한 DART 클라이언트 반환.
     
     Args:
         config: AppConfig 또는 DartApiConfig
+        stop_event: 요청 수 제한 대기를 중단하는 종료 이벤트 (실제 클라이언트만 사용)
         
     Returns:
         DartApiClient 또는 MockDartApiClient
@@ -227,5 +247,7 @@ def get_dart_client(config):
         logger.info("🔗 Using real DartApiClient")
         return DartApiClient(
             api_key=dart_config.api_key,
-            timeout=dart_config.timeout
+            timeout=dart_config.timeout,
+            rate_limit_per_minute=dart_config.rate_limit_per_minute,
+            stop_event=stop_event,
         )
@@ -1,9 +1,37 @@
 import io
+import os
 import logging
 import mimetypes                                                                # 파일 확장자를 기반으로 MIME 타입을 추측하기 위한 모듈
+import certifi
+import urllib3
+from urllib3.util.retry import Retry
 from minio import Minio                                                         # MinIO 서버와 통신하기 위한 메인 라이브러리
 from minio.error import S3Error                                                 # MinIO 관련 예외처리를 위한 클래스
 
+logger = logging.getLogger(__name__)
+
+# 연결 풀 크기: 기본값(10)보다 크게 두어 동시 업로드/조회 시에도 keep-alive 연결을 재사용
+POOL_MAXSIZE = 32
+REQUEST_TIMEOUT_SECONDS = 300
+UPLOAD_PART_SIZE = 64 * 1024 * 1024                                             # 멀티파트 업로드 파트 크기 (이보다 작은 문서는 단일 PUT)
+
+
+# ---------- MinIO SDK 기본 설정(타임아웃, CA, 재시도)을 유지하면서 풀 크기만 조정한 PoolManager 생성 ----------
+def _build_http_client(secure: bool) -> urllib3.PoolManager:
+    return urllib3.PoolManager(
+        timeout=urllib3.Timeout(connect=REQUEST_TIMEOUT_SECONDS, read=REQUEST_TIMEOUT_SECONDS),
+        maxsize=POOL_MAXSIZE,
+        block=False,                                                            # 풀이 가득 차도 대기하지 않고 임시 연결 생성
+        cert_reqs='CERT_REQUIRED' if secure else 'CERT_NONE',
+        ca_certs=os.environ.get('SSL_CERT_FILE') or certifi.where(),
+        retries=Retry(
+            total=5,
+            backoff_factor=0.2,
+            status_forcelist=[500, 502, 503, 504],
+        ),
+    )
+
+
 # -------------------- MinIO 객체 스토리지 서버와의 연결 및 파일 관리를 담당하는 클래스 --------------------
 class MinIOClient:
     
@@ -14,12 +42,13 @@ class MinIOClient:
                 endpoint,
                 access_key=access_key,
                 secret_key=secret_key,
-                secure=secure
+                secure=secure,
+                http_client=_build_http_client(secure),                         # 모든 요청이 하나의 연결 풀을 공유
             )
             self.bucket_name = bucket_name
             self._ensure_bucket_exists()                                        # 생성자에서 버킷 존재 여부를 확인하고, 없으면 생성
         except Exception as e:                                                  # 초기화 과정에서 발생하는 모든 예외 처리
-            logging.error(f"Failed to initialize Minio client: {e}")
+            logger.error(f"Failed to initialize Minio client: {e}")
             raise
 
     # ---------- 지정된 버킷이 존재하는지 확인하고, 없으면 새로 생성하는 내부 메서드 ----------
@@ -28,9 +57,9 @@ class MinIOClient:
             found = self.client.bucket_exists(self.bucket_name)                 # 버킷 존재 여부 확인
             if not found:
                 self.client.make_bucket(self.bucket_name)                       # 버킷이 없으면 생성
-                logging.info(f"Bucket '{self.bucket_name}' created.")
+                logger.info(f"Bucket '{self.bucket_name}' created.")
         except S3Error as e:                                                    # 버킷 확인/생성 중 발생할 수 있는 S3 관련 오류 처리
-            logging.error(f"Error checking or creating bucket '{self.bucket_name}': {e}")
+            logger.error(f"Error checking or creating bucket '{self.bucket_name}': {e}")
             raise
         
     # ---------- 특정 객체(파일)가 버킷에 이미 존재하는지 확인 ----------
@@ -49,9 +78,18 @@ class MinIOClient:
         except S3Error as e:
             if e.code == 'NoSuchKey':                                           # 'NoSuchKey' 에러는 객체가 존재하지 않음을 의미
                 return False
-            logging.error(f"Error checking existence of {object_name}: {e}")    # 그 외의 에러는 로그로 기록
+            logger.error(f"Error checking existence of {object_name}: {e}")    # 그 외의 에러는 로그로 기록
             return False
 
+    # ---------- 접두사 아래의 객체 이름을 한 번의 목록 조회로 수집 (오류 시 None) ----------
+    def list_object_names(self, prefix: str) -> set[str] | None:
+        try:
+            objects = self.client.list_objects(self.bucket_name, prefix=prefix, recursive=True)
+            return {obj.object_name for obj in objects}
+        except S3Error as e:
+            logger.error(f"Error listing objects under {prefix}: {e}")
+            return None
+
     # ---------- 주어진 바이트 데이터를 MinIO 버킷에 객체로 업로드 ----------
     def upload_document(self, object_name: str, content_bytes: bytes, content_type: str | None) -> bool:
         try:
@@ -60,16 +98,17 @@ class MinIOClient:
                 if content_type is None:
                     content_type = 'application/octet-stream'                   # 타입을 알 수 없으면 일반 바이너리로 설정
 
-            content_stream = io.BytesIO(content_bytes)                          # 바이트 데이터를 메모리 내 스트림으로 변환
+            content_stream = io.BytesIO(content_bytes)                          # 바이트 데이터를 메모리 내 스트림으로 변환 (버퍼 복사 없음)
             
             self.client.put_object(                                             # put_object API를 사용하여 실제 파일 업로드 실행
                 self.bucket_name,
                 object_name,
                 content_stream,
                 len(content_bytes),
-                content_type=content_type
+                content_type=content_type,
+                part_size=UPLOAD_PART_SIZE,
             )
             return True                                                         # 업로드 성공
         except S3Error as e:                                                    # 파일 업로드 중 발생할 수 있는 모든 S3 관련 오류 처리
-            logging.error(f"Failed to upload {object_name} to Minio: {e}")
+            logger.error(f"Failed to upload {object_name} to Minio: {e}")
             return False
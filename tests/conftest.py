@@ -7,7 +7,7 @@ Pytest fixtures for Ingestion Service tests.
 import pytest
 import os
 import sys
-from unittest.mock import MagicMock, AsyncMock, patch
+from unittest.mock import Mock, MagicMock, AsyncMock, patch
 from datetime import datetime
 
 # Producer 모듈 경로 추가
@@ -79,6 +79,22 @@ def sample_dart_api_response() -> list:
     ]
 
 
+@pytest.fixture
+def make_disclosure(sample_dart_api_response):
+    """sample_dart_api_response 첫 항목으로 Disclosure를 만드는 함수 (접수번호/접수일자 지정 가능)"""
+    from models.disclosure import Disclosure
+
+    def _make(rcept_no: str = None, rcept_dt: str = None):
+        item = dict(sample_dart_api_response[0])
+        if rcept_no:
+            item["rcept_no"] = rcept_no
+        if rcept_dt:
+            item["rcept_dt"] = rcept_dt
+        return Disclosure.from_dict(item)
+
+    return _make
+
+
 @pytest.fixture
 def sample_html_document() -> bytes:
     """샘플 HTML 문서"""
@@ -99,17 +115,50 @@ def sample_html_document() -> bytes:
 # Mock Fixtures
 # ============================================================
 
+class FakeMinio:
+    """put/stat/list/get만 지원하는 인메모리 Minio 대역"""
+
+    def __init__(self):
+        self.objects = {}
+
+    def bucket_exists(self, bucket_name):
+        return True
+
+    def make_bucket(self, bucket_name):
+        pass
+
+    def put_object(self, bucket_name, object_name, data, length, **kwargs):
+        self.objects[object_name] = data.read(length) if length >= 0 else data.read()
+
+    def stat_object(self, bucket_name, object_name):
+        from minio.datatypes import Object
+        from minio.error import S3Error
+
+        if object_name not in self.objects:
+            raise S3Error("NoSuchKey", "Object does not exist", object_name, None, None, None,
+                          bucket_name, object_name)
+        return Object(bucket_name, object_name, size=len(self.objects[object_name]))
+
+    def list_objects(self, bucket_name, prefix=None, recursive=False, **kwargs):
+        from minio.datatypes import Object
+
+        return iter([
+            Object(bucket_name, name, size=len(data))
+            for name, data in sorted(self.objects.items())
+            if name.startswith(prefix or "")
+        ])
+
+    def get_object(self, bucket_name, object_name):
+        import io
+
+        return io.BytesIO(self.objects[object_name])
+
+
 @pytest.fixture
 def mock_minio_client():
-    """MinIO 클라이언트 Mock"""
+    """MinIO 클라이언트 Mock (객체를 메모리에 보관하는 FakeMinio)"""
     with patch("services.storage_client.Minio") as mock:
-        client = MagicMock()
-        client.bucket_exists.return_value = True
-        client.put_object.return_value = MagicMock()
-        client.get_object.return_value = MagicMock(
-            read=lambda: b"test content",
-            close=lambda: None
-        )
+        client = FakeMinio()
         mock.return_value = client
         yield client
 
@@ -126,17 +175,24 @@ def mock_celery_task():
 
 @pytest.fixture
 def mock_httpx_client():
-    """HTTP 클라이언트 Mock"""
-    with patch("httpx.Client") as mock:
-        client = MagicMock()
-        response = MagicMock()
-        response.status_code = 200
-        response.json.return_value = {"status": "success"}
-        client.put.return_value = response
-        client.get.return_value = response
-        mock.return_value.__enter__ = MagicMock(return_value=client)
-        mock.return_value.__exit__ = MagicMock(return_value=False)
-        yield client
+    """
+    HTTP 클라이언트 Mock.
+
+    httpx.Client 생성을 가로채 (client, response) 튜플을 반환합니다.
+    response는 기본적으로 201 / 빈 JSON이며 테스트에서 필요한 값만 덮어씁니다.
+    """
+    import httpx
+    
+    # spec_set으로 실제 httpx.Client에 없는 속성 접근/설정을 막음 (patch 전에 spec 생성)
+    client = Mock(spec_set=httpx.Client)
+    response = Mock(spec=httpx.Response)
+    response.status_code = 201
+    response.json.return_value = {}
+    client.put.return_value = response
+    client.get.return_value = response
+    
+    with patch("httpx.Client", return_value=client):
+        yield client, response
 
 
 # ============================================================
@@ -155,6 +211,7 @@ def mock_config():
         timeout: int = 30
         max_retries: int = 3
         mock_mode: bool = True
+        rate_limit_per_minute: int = 900
     
     @dataclass
     class MockMinioConfig:
@@ -65,6 +65,15 @@ class TestDartApiConfig:
         errors = config.validate()
         assert errors == []
 
+    def test_rate_limit_validation(self):
+        """분당 요청 제한 범위 검증 (1-1000)"""
+        from config import DartApiConfig
+        
+        config = DartApiConfig(api_key="a" * 40, rate_limit_per_minute=1500)
+        
+        errors = config.validate()
+        assert any("DART_RATE_LIMIT_PER_MINUTE" in e for e in errors)
+
 
 class TestMinioConfig:
     """MinIO 설정 테스트"""
@@ -146,6 +155,24 @@ class TestPollingConfig:
         
         errors = config.validate()
         assert any("interval" in e.lower() for e in errors)
+    
+    def test_rss_interval_validation(self):
+        """RSS 확인 간격 검증"""
+        from config import PollingConfig
+        
+        assert PollingConfig().rss_interval_seconds == 30
+        
+        errors = PollingConfig(rss_interval_seconds=1).validate()
+        assert any("RSS_POLL_INTERVAL" in e for e in errors)
+    
+    def test_workers_validation(self):
+        """동시 처리 스레드 수 검증"""
+        from config import PollingConfig
+        
+        assert PollingConfig().workers == 4
+        
+        errors = PollingConfig(workers=0).validate()
+        assert any("PROCESS_WORKERS" in e for e in errors)
 
 
 class TestConfigLoading:
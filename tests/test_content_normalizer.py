@@ -0,0 +1,332 @@
+"""
+Content Normalizer Tests
+
+normalize_payload 콘텐츠 정규화 테스트
+"""
+
+import pytest
+import os
+import sys
+import io
+import zipfile
+
+# Producer 모듈 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'producer'))
+
+
+def _make_zip(members: dict) -> bytes:
+    """파일명 → 바이트 매핑으로 ZIP 생성"""
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return buf.getvalue()
+
+
+HTML_CP949 = (
+    '<html><head><meta charset="euc-kr"><title>공시</title></head>'
+    '<body><p>삼성전자 사업보고서</p></body></html>'
+).encode('cp949')
+
+XML_UTF8 = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n<DOCUMENT><TITLE>사업보고서</TITLE></DOCUMENT>'
+).encode('utf-8')
+
+
+class TestNormalizeZip:
+    """ZIP 페이로드 정규화 테스트"""
+
+    def test_zip_picks_html_over_xml(self):
+        """ZIP 내 HTML이 XML보다 우선 선택됨"""
+        from services.content_normalizer import normalize_payload
+
+        body = _make_zip({"a.xml": XML_UTF8, "b.html": HTML_CP949})
+        content_type, data, filename = normalize_payload("20241229000001", body)
+
+        assert content_type == 'text/html; charset=UTF-8'
+        assert filename == '20241229000001.html'
+        assert '삼성전자 사업보고서' in data.decode('utf-8')
+
+    def test_zip_picks_largest_of_same_kind(self):
+        """같은 종류면 큰 파일이 선택됨"""
+        from services.content_normalizer import normalize_payload
+
+        large = XML_UTF8.replace(b'</DOCUMENT>', b'<BODY>' + b'x' * 1000 + b'</BODY></DOCUMENT>')
+        body = _make_zip({"small.xml": XML_UTF8, "large.xml": large})
+        content_type, data, filename = normalize_payload("20241229000002", body)
+
+        assert content_type == 'application/xml; charset=UTF-8'
+        assert len(data) == len(large)
+
+    def test_binary_extension_skips_sniffing(self, monkeypatch):
+        """이미지 확장자 멤버는 압축 해제/판별 없이 bin으로 분류됨"""
+        from services import content_normalizer
+        from services.content_normalizer import normalize_payload
+
+        sniffed = []
+        real_sniff = content_normalizer.sniff_kind
+        monkeypatch.setattr(content_normalizer, "sniff_kind", lambda data: sniffed.append(data) or real_sniff(data))
+
+        body = _make_zip({"doc.xml": XML_UTF8, "chart.png": b'\x89PNG' + b'\x00' * 5000})
+        content_type, data, filename = normalize_payload("20241229000003", body)
+
+        assert content_type == 'application/xml; charset=UTF-8'
+        assert not any(d.startswith(b'\x89PNG') for d in sniffed)
+
+    def test_markup_extension_members_sniffed_first(self):
+        """마크업 확장자 멤버가 있으면 다른 확장자 멤버는 판별하지 않음"""
+        from services.content_normalizer import normalize_payload
+
+        body = _make_zip({"doc.xml": XML_UTF8, "notes.txt": HTML_CP949})
+        content_type, data, filename = normalize_payload("20241229000004", body)
+
+        assert content_type == 'application/xml; charset=UTF-8'
+
+        body = _make_zip({"notes.txt": HTML_CP949, "data.dat": b"\x00\x01"})
+        content_type, data, filename = normalize_payload("20241229000005", body)
+
+        assert content_type == 'text/html; charset=UTF-8'
+
+    def test_stops_sniffing_after_largest_html(self, monkeypatch):
+        """가장 큰 멤버가 HTML이면 나머지 멤버는 판별하지 않음"""
+        from services import content_normalizer
+        from services.content_normalizer import normalize_payload
+
+        sniffed = []
+        real_sniff = content_normalizer.sniff_kind
+        monkeypatch.setattr(content_normalizer, "sniff_kind", lambda data: sniffed.append(data) or real_sniff(data))
+
+        large = HTML_CP949.replace(b'</body>', b'<p>' + b'x' * 1000 + b'</p></body>')
+        body = _make_zip({"a.xml": XML_UTF8, "small.html": HTML_CP949, "large.html": large})
+        content_type, data, filename = normalize_payload("20241229000006", body)
+
+        assert content_type == 'text/html; charset=UTF-8'
+        assert b'x' * 1000 in data
+        assert len(sniffed) == 1
+
+    def test_broken_zip_falls_back_to_original(self):
+        """손상된 ZIP은 원본 그대로 반환"""
+        from services.content_normalizer import normalize_payload
+
+        body = b'PK\x03\x04' + b'\x00' * 64
+        content_type, data, filename = normalize_payload("20241229000003", body)
+
+        assert content_type == 'application/octet-stream'
+        assert data == body
+        assert filename == '20241229000003.zip'
+
+    def test_empty_zip_detected_by_signature(self):
+        """빈 ZIP(EOCD 시그니처로 시작)도 ZIP으로 판별됨"""
+        from services.content_normalizer import normalize_payload
+
+        body = _make_zip({})
+        assert body.startswith(b'PK\x05\x06')
+
+        content_type, data, filename = normalize_payload("20241229000004", body)
+
+        assert content_type == 'application/octet-stream'
+        assert filename == '20241229000004.zip'
+
+    def test_single_member_fast_path_matches_zipfile(self, monkeypatch):
+        """단일 멤버 빠른 경로와 ZipFile 경로의 결과가 동일"""
+        from services import content_normalizer
+        from services.content_normalizer import normalize_payload, _read_single_member
+
+        body = _make_zip({"doc.html": HTML_CP949})
+        assert _read_single_member(body) is not None
+
+        fast = normalize_payload("20241229000005", body)
+        monkeypatch.setattr(content_normalizer, "_read_single_member", lambda b: None)
+        slow = normalize_payload("20241229000005", body)
+
+        assert fast == slow
+
+    def test_single_member_corrupt_crc_falls_back(self):
+        """CRC가 맞지 않으면 빠른 경로를 사용하지 않음"""
+        from services.content_normalizer import _read_single_member
+
+        body = bytearray(_make_zip({"doc.xml": XML_UTF8}))
+        body[14] ^= 0xFF  # 로컬 헤더의 CRC-32 필드 변조
+
+        assert _read_single_member(bytes(body)) is None
+
+
+class TestNormalizeDocument:
+    """단일 문서 정규화 테스트"""
+
+    def test_html_converted_to_utf8(self):
+        """CP949 HTML이 UTF-8로 변환되고 charset 선언이 갱신됨"""
+        from services.content_normalizer import normalize_payload, validate_utf8
+
+        content_type, data, filename = normalize_payload("doc", HTML_CP949)
+
+        assert content_type == 'text/html; charset=UTF-8'
+        assert validate_utf8(data)
+        assert b'euc-kr' not in data.lower()
+        assert data.startswith(b'<html><head><meta charset="UTF-8"><title>')
+
+    def test_xml_declaration_skips_auto_detection(self, monkeypatch):
+        """XML 선언이 있으면 chardet 없이 선언된 인코딩으로 변환됨"""
+        from services import content_normalizer
+        from services.content_normalizer import normalize_payload
+
+        def fail_detect(data):
+            raise AssertionError("chardet should not be called")
+
+        monkeypatch.setattr(content_normalizer, "_detect_encoding_auto", fail_detect)
+
+        body = '<?xml version="1.0" encoding="EUC-KR"?>\n<DOC>사업보고서</DOC>'.encode('euc-kr')
+        content_type, data, filename = normalize_payload("doc", body)
+
+        assert content_type == 'application/xml; charset=UTF-8'
+        assert data.startswith(b'<?xml version="1.0" encoding="UTF-8"?>')
+        assert '사업보고서' in data.decode('utf-8')
+
+    def test_html_meta_charset_skips_auto_detection(self, monkeypatch):
+        """HTML meta charset 선언이 있으면 chardet 없이 변환됨"""
+        from services import content_normalizer
+        from services.content_normalizer import normalize_payload
+
+        def fail_detect(data):
+            raise AssertionError("chardet should not be called")
+
+        monkeypatch.setattr(content_normalizer, "_detect_encoding_auto", fail_detect)
+
+        content_type, data, filename = normalize_payload("doc", HTML_CP949)
+
+        assert content_type == 'text/html; charset=UTF-8'
+        assert '삼성전자 사업보고서' in data.decode('utf-8')
+
+    def test_probe_boundary_inside_multibyte_char(self):
+        """사전 검사 구간 경계가 멀티바이트 문자 중간이어도 선언된 인코딩으로 변환됨"""
+        from services.content_normalizer import normalize_payload, ENCODING_PROBE_N
+
+        prefix = '<html><head><meta charset="euc-kr"></head><body>'
+        pad = 'a' * (ENCODING_PROBE_N - len(prefix) - 1)
+        html = f'{prefix}{pad}한글 본문</body></html>'
+        raw = html.encode('cp949')
+        assert raw[ENCODING_PROBE_N - 1:ENCODING_PROBE_N + 1] == '한'.encode('cp949')
+
+        content_type, data, filename = normalize_payload("doc", raw)
+
+        assert data.decode('utf-8').endswith(f'{pad}한글 본문</body></html>')
+
+    def test_utf8_fast_path_skips_detection(self, monkeypatch):
+        """유효한 UTF-8은 인코딩 감지 없이 BOM만 제거하고 선언부를 교체"""
+        from services import content_normalizer
+        from services.content_normalizer import _to_utf8_with_rewrite
+
+        def fail_detect(*args):
+            raise AssertionError("encoding detection should not be called")
+
+        monkeypatch.setattr(content_normalizer, "_detect_encoding_from_declaration", fail_detect)
+        monkeypatch.setattr(content_normalizer, "_detect_encoding_auto", fail_detect)
+
+        html = '<html><head><meta charset="euc-kr"></head><body>한글</body></html>'.encode('utf-8')
+
+        data, used_enc = _to_utf8_with_rewrite(html, 'html')
+        assert used_enc == 'utf-8'
+        assert data == '<html><head><meta charset="UTF-8"></head><body>한글</body></html>'.encode('utf-8')
+
+        data, used_enc = _to_utf8_with_rewrite(b'\xef\xbb\xbf' + html, 'html')
+        assert used_enc == 'utf-8-sig'
+        assert data.startswith(b'<html>')
+
+    def test_utf16_bom_skips_detection(self, monkeypatch):
+        """UTF-16 BOM이 있으면 선언부 검색/자동 감지 없이 UTF-8로 변환"""
+        from services import content_normalizer
+        from services.content_normalizer import _to_utf8_with_rewrite
+
+        def fail_detect(*args):
+            raise AssertionError("encoding detection should not be called")
+
+        monkeypatch.setattr(content_normalizer, "_detect_encoding_from_declaration", fail_detect)
+        monkeypatch.setattr(content_normalizer, "_detect_encoding_auto", fail_detect)
+
+        xml = '<?xml version="1.0" encoding="UTF-16"?>\n<DOC>사업보고서</DOC>'
+
+        data, used_enc = _to_utf8_with_rewrite(xml.encode('utf-16'), 'xml')
+
+        assert used_enc == 'utf-16'
+        assert data == '<?xml version="1.0" encoding="UTF-8"?>\n<DOC>사업보고서</DOC>'.encode('utf-8')
+
+    def test_utf8_xml_body_preserved(self):
+        """UTF-8 XML은 선언부 외 본문 바이트가 그대로 유지됨"""
+        from services.content_normalizer import normalize_payload
+
+        body = '<?xml version="1.0" encoding="utf-8"?>\n<DOC>사업보고서</DOC>'.encode('utf-8')
+        content_type, data, filename = normalize_payload("doc", body)
+
+        assert data.startswith(b'<?xml version="1.0" encoding="UTF-8"?>')
+        assert data.endswith('\n<DOC>사업보고서</DOC>'.encode('utf-8'))
+
+    def test_large_html_body_preserved(self):
+        """큰 HTML도 charset 선언만 바뀌고 본문은 그대로 유지됨"""
+        from services.content_normalizer import normalize_payload, READ_HEAD_N
+
+        body_text = '<p>공시 본문</p>' * (READ_HEAD_N // 10)
+        html = f'<html><head><meta charset="euc-kr"></head><body>{body_text}</body></html>'
+        content_type, data, filename = normalize_payload("doc", html.encode('cp949'))
+
+        text = data.decode('utf-8')
+        assert text == f'<html><head><meta charset="UTF-8"></head><body>{body_text}</body></html>'
+
+
+class TestDetectEncodingFromDeclaration:
+    """HTML 선언부 charset 감지 테스트"""
+
+    HTML_HTTP_EQUIV = (
+        '<html><head><meta http-equiv="Content-Type" content="text/html; charset=euc-kr">'
+        '<title>공시</title></head><body>본문</body></html>'
+    ).encode('cp949')
+
+    @pytest.mark.parametrize("use_selectolax", [True, False])
+    def test_meta_charset_and_http_equiv(self, monkeypatch, use_selectolax):
+        """selectolax/정규식 경로 모두 meta charset과 http-equiv를 인식"""
+        from services import content_normalizer
+
+        if use_selectolax and not content_normalizer.HAS_SELECTOLAX:
+            pytest.skip("selectolax not installed")
+        monkeypatch.setattr(content_normalizer, "HAS_SELECTOLAX", use_selectolax)
+
+        detect = content_normalizer._detect_encoding_from_declaration
+        assert detect(HTML_CP949, 'html') == 'euc-kr'
+        assert detect(self.HTML_HTTP_EQUIV, 'html') == 'euc-kr'
+        assert detect(b'<html><body>no charset</body></html>', 'html') is None
+
+
+class TestSniffKind:
+    """sniff_kind 콘텐츠 종류 감지 테스트"""
+
+    @pytest.mark.parametrize("data, expected", [
+        (b'<HTML lang="ko"><body>x</body></HTML>', 'html'),
+        (b'<!DOCTYPE html><p>x</p>', 'html'),
+        (b'<head><title>x</title></head>', 'html'),
+        (b'<meta http-equiv="Content-Type" content="text/html; charset=euc-kr">', 'html'),
+        (XML_UTF8, 'xml'),
+        (b'<DOCUMENT><TITLE>' + b'x' * 200000 + b'</TITLE></DOCUMENT>', 'xml'),
+        (b'\x00\x01\x02binary', 'bin'),
+        (b'%PDF-1.7\n<html><head></head></html>', 'bin'),
+        (b'\n\t  <?xml version="1.0"?><DOC/>', 'xml'),
+    ])
+    def test_detects_kind(self, data, expected):
+        """HTML 패턴 중 하나라도 있으면 html, XML 선언은 xml, 그 외 bin"""
+        from services.content_normalizer import sniff_kind
+
+        assert sniff_kind(data) == expected
+
+    def test_unclosed_tags_do_not_backtrack_quadratically(self):
+        """'>'가 없는 태그 반복 입력도 빠르게 판별됨"""
+        import time
+        from services.content_normalizer import sniff_kind, READ_HEAD_N
+
+        inputs = [
+            (b'<meta ' * (READ_HEAD_N // 6 + 1))[:READ_HEAD_N],
+            (b'<meta ' + b'http-equiv="content-type" ' * (READ_HEAD_N // 26))[:READ_HEAD_N],
+        ]
+
+        for data in inputs:
+            started = time.monotonic()
+            sniff_kind(data)
+
+            assert time.monotonic() - started < 0.5
@@ -0,0 +1,232 @@
+"""
+DART API Client Tests
+
+DartApiClient 에러 응답 파싱 및 요청 수 제한 테스트
+"""
+
+import pytest
+import os
+import sys
+import time
+
+# Producer 모듈 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'producer'))
+
+
+class TestParseXmlError:
+    """DartApiClient._parse_xml_error 테스트"""
+
+    @pytest.mark.parametrize("content, expected", [
+        (
+            '<?xml version="1.0" encoding="utf-8"?>\n<result>\n'
+            '<status>013</status>\n<message>조회된 데이타가 없습니다.</message>\n</result>'.encode('utf-8'),
+            ("013", "조회된 데이타가 없습니다."),
+        ),
+        # 엔티티가 포함된 메시지는 XML 파서 경로로 처리
+        (
+            b'<result><status>100</status><message>a &amp; b</message></result>',
+            ("100", "a & b"),
+        ),
+        # message가 없는 응답
+        (
+            b'<result><status>800</status></result>',
+            ("800", "Unknown error"),
+        ),
+    ], ids=["fast_path", "entity", "no_message"])
+    def test_parses_error_envelope(self, content, expected):
+        """에러 응답의 status/message 추출"""
+        from services.dart_api_client import DartApiClient
+
+        client = DartApiClient(api_key="a" * 40)
+
+        assert client._parse_xml_error(content) == expected
+
+    def test_returns_none_for_non_xml(self):
+        """XML이 아닌 응답은 None"""
+        from services.dart_api_client import DartApiClient
+
+        client = DartApiClient(api_key="a" * 40)
+
+        assert client._parse_xml_error(b'<html><body>not an error</body></html>') is None
+
+    def test_skips_entity_declarations(self):
+        """DOCTYPE(엔티티 선언)이 있는 응답은 파싱하지 않음"""
+        from services.dart_api_client import DartApiClient
+
+        client = DartApiClient(api_key="a" * 40)
+        content = (
+            b'<?xml version="1.0"?><!DOCTYPE r [<!ENTITY a "aaaaaaaaaa">'
+            b'<!ENTITY b "&a;&a;&a;&a;&a;&a;&a;&a;&a;&a;">]>'
+            b'<r><status>&b;</status></r>'
+        )
+
+        assert client._parse_xml_error(content) is None
+
+
+class TestRateLimiter:
+    """_RateLimiter 테스트"""
+
+    def test_blocks_until_window_frees(self):
+        """윈도우 내 허용 건수를 넘으면 가장 오래된 요청이 빠질 때까지 대기"""
+        from services.dart_api_client import _RateLimiter
+
+        limiter = _RateLimiter(max_calls=2, period=0.2)
+
+        start = time.monotonic()
+        limiter.acquire()
+        limiter.acquire()
+        assert time.monotonic() - start < 0.1
+
+        limiter.acquire()
+        assert time.monotonic() - start >= 0.2
+
+    def test_stop_event_interrupts_wait(self):
+        """대기 중 종료 이벤트가 설정되면 윈도우를 기다리지 않고 False 반환"""
+        import threading
+        from services.dart_api_client import _RateLimiter
+
+        stop_event = threading.Event()
+        limiter = _RateLimiter(max_calls=1, period=60.0, stop_event=stop_event)
+        assert limiter.acquire() is True
+
+        threading.Timer(0.05, stop_event.set).start()
+        start = time.monotonic()
+        assert limiter.acquire() is False
+        assert time.monotonic() - start < 5.0
+
+    def test_client_raises_cancelled_when_stopped(self):
+        """종료 신호로 대기가 중단되면 요청을 보내지 않고 DartApiCancelledError"""
+        import threading
+        from unittest.mock import MagicMock
+        from services.dart_api_client import DartApiClient, DartApiCancelledError
+
+        stop_event = threading.Event()
+        client = DartApiClient(api_key="a" * 40, rate_limit_per_minute=1, stop_event=stop_event)
+        client.session = MagicMock()
+        client.session.get.return_value.content = b'PK\x03\x04zip'
+
+        assert client.fetch_document_content("20241229000001") == b'PK\x03\x04zip'
+
+        stop_event.set()
+        with pytest.raises(DartApiCancelledError):
+            client.fetch_document_content("20241229000002")
+        assert client.session.get.call_count == 1
+
+
+def _rss_feed(*items) -> bytes:
+    """(rcept_no, pubDate) 목록으로 RSS 피드 본문 생성"""
+    body = "".join(
+        f"<item><title>공시</title>"
+        f"<link>https://dart.fss.or.kr/api/link.jsp?rcpNo={rcept_no}</link>"
+        f"<pubDate>{pub_date}</pubDate></item>"
+        for rcept_no, pub_date in items
+    )
+    return f'<?xml version="1.0" encoding="utf-8"?><rss><channel>{body}</channel></rss>'.encode('utf-8')
+
+
+def _rss_response(status_code=200, content=b"", headers=None):
+    from unittest.mock import MagicMock
+
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = content
+    response.headers = headers or {}
+    return response
+
+
+class TestFetchRssUpdates:
+    """DartApiClient.fetch_rss_updates 테스트"""
+
+    def _client(self):
+        from unittest.mock import MagicMock
+        from services.dart_api_client import DartApiClient
+
+        client = DartApiClient(api_key="a" * 40)
+        client.session = MagicMock()
+        return client
+
+    def test_returns_new_rcept_nos(self):
+        """200 응답이면 항목의 rcpNo를 추출하고 ETag/Last-Modified를 저장"""
+        client = self._client()
+        client.session.get.return_value = _rss_response(
+            content=_rss_feed(
+                ("20241229000001", "Sun, 29 Dec 2024 09:00:00 +0900"),
+                ("20241229000002", "Sun, 29 Dec 2024 09:05:00 +0900"),
+            ),
+            headers={"ETag": '"v1"', "Last-Modified": "Sun, 29 Dec 2024 00:05:00 GMT"},
+        )
+
+        assert client.fetch_rss_updates() == ["20241229000001", "20241229000002"]
+        assert client._rss_etag == '"v1"'
+        assert client._rss_last_modified == "Sun, 29 Dec 2024 00:05:00 GMT"
+
+    def test_not_modified(self):
+        """304 응답이면 조건부 헤더를 보내고 빈 목록 반환"""
+        client = self._client()
+        client._rss_etag = '"v1"'
+        client._rss_last_modified = "Sun, 29 Dec 2024 00:05:00 GMT"
+        client.session.get.return_value = _rss_response(status_code=304)
+
+        assert client.fetch_rss_updates() == []
+        headers = client.session.get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+        assert headers["If-Modified-Since"] == "Sun, 29 Dec 2024 00:05:00 GMT"
+
+    def test_skips_items_before_high_water(self):
+        """마지막으로 본 pubDate 이전 항목은 제외하고 같은 시각 항목은 포함"""
+        client = self._client()
+        client.session.get.return_value = _rss_response(
+            content=_rss_feed(("20241229000002", "Sun, 29 Dec 2024 09:05:00 +0900"))
+        )
+        assert client.fetch_rss_updates() == ["20241229000002"]
+
+        client.session.get.return_value = _rss_response(
+            content=_rss_feed(
+                ("20241229000001", "Sun, 29 Dec 2024 09:00:00 +0900"),
+                ("20241229000002", "Sun, 29 Dec 2024 09:05:00 +0900"),
+                ("20241229000003", "Sun, 29 Dec 2024 09:10:00 +0900"),
+            )
+        )
+        assert client.fetch_rss_updates() == ["20241229000002", "20241229000003"]
+
+    def test_malformed_feed_returns_none(self):
+        """파싱할 수 없는 피드는 None을 반환하고 조건부 GET 상태를 갱신하지 않음"""
+        client = self._client()
+        client.session.get.return_value = _rss_response(
+            content=b"<rss><channel><item>", headers={"ETag": '"broken"'}
+        )
+
+        assert client.fetch_rss_updates() is None
+        assert client._rss_etag is None
+
+    def test_request_failure_returns_none(self):
+        """요청 실패 시 None"""
+        import requests
+
+        client = self._client()
+        client.session.get.side_effect = requests.exceptions.ConnectionError("refused")
+
+        assert client.fetch_rss_updates() is None
+
+
+class TestRssGate:
+    """has_new_rss_disclosures 테스트"""
+
+    @pytest.mark.parametrize("rss_result, expected", [
+        (["20241229000001", "20241229000002"], True),
+        (["20241229000001"], False),
+        ([], False),
+        (None, False),
+    ], ids=["unseen", "all_processed", "not_modified", "feed_failed"])
+    def test_detects_unprocessed(self, rss_result, expected):
+        """처리하지 않은 접수번호가 있을 때만 목록 조회"""
+        import logging
+        from unittest.mock import MagicMock
+        from main import ProcessingState, has_new_rss_disclosures
+
+        api = MagicMock()
+        api.fetch_rss_updates.return_value = rss_result
+        state = ProcessingState()
+        state.mark_processed("20241229000001")
+
+        assert has_new_rss_disclosures(api, state, logging.getLogger("test")) is expected
@@ -7,7 +7,7 @@ Consumer의 DisclosureServiceClient 기능 테스트
 import pytest
 import os
 import sys
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, Mock, MagicMock
 
 # Consumer 모듈 경로 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'consumer'))
@@ -70,20 +70,31 @@ class TestDisclosureServiceClient:
         
         assert "WORKER_API_KEY is not set" in caplog.text
     
-    @patch("httpx.Client")
-    def test_upsert_disclosure_success(self, mock_client_class, sample_disclosure_message):
+    def test_http_client_reused(self):
+        """httpx.Client는 한 번만 생성되어 재사용되고 close() 후 다시 생성"""
+        from tasks import DisclosureServiceClient
+        
+        client = DisclosureServiceClient(
+            base_url="http://localhost:8000",
+            api_key="test-api-key"
+        )
+        
+        first = client._get_client()
+        assert client._get_client() is first
+        assert first.headers["X-Worker-API-Key"] == "test-api-key"
+        
+        client.close()
+        assert first.is_closed
+        assert client._get_client() is not first
+        client.close()
+    
+    def test_upsert_disclosure_success(self, mock_httpx_client, sample_disclosure_message):
         """공시 저장 성공"""
         from tasks import DisclosureServiceClient
         
         # Mock 설정
-        mock_client = MagicMock()
-        mock_response = MagicMock()
-        mock_response.status_code = 201
+        mock_client, mock_response = mock_httpx_client
         mock_response.json.return_value = {"rcept_no": sample_disclosure_message["rcept_no"]}
-        mock_response.raise_for_status = MagicMock()
-        mock_client.put.return_value = mock_response
-        mock_client_class.return_value.__enter__ = MagicMock(return_value=mock_client)
-        mock_client_class.return_value.__exit__ = MagicMock(return_value=False)
         
         # 테스트
         client = DisclosureServiceClient(
@@ -99,15 +110,13 @@ class TestDisclosureServiceClient:
         assert result["rcept_no"] == sample_disclosure_message["rcept_no"]
         mock_client.put.assert_called_once()
     
-    @patch("httpx.Client")
-    def test_upsert_disclosure_failure(self, mock_client_class, sample_disclosure_message):
+    def test_upsert_disclosure_failure(self, mock_httpx_client, sample_disclosure_message):
         """공시 저장 실패 (5xx 에러)"""
         from tasks import DisclosureServiceClient
         import httpx
         
         # Mock 설정 - 5xx 에러
-        mock_client = MagicMock()
-        mock_response = MagicMock()
+        mock_client, mock_response = mock_httpx_client
         mock_response.status_code = 500
         mock_response.text = "Internal Server Error"
         
@@ -117,9 +126,6 @@ class TestDisclosureServiceClient:
             response=mock_response
         )
         mock_response.raise_for_status.side_effect = error
-        mock_client.put.return_value = mock_response
-        mock_client_class.return_value.__enter__ = MagicMock(return_value=mock_client)
-        mock_client_class.return_value.__exit__ = MagicMock(return_value=False)
         
         # 테스트
         client = DisclosureServiceClient(
@@ -134,15 +140,13 @@ class TestDisclosureServiceClient:
                 sample_disclosure_message
             )
     
-    @patch("httpx.Client")
-    def test_upsert_disclosure_auth_failure(self, mock_client_class, sample_disclosure_message):
+    def test_upsert_disclosure_auth_failure(self, mock_httpx_client, sample_disclosure_message):
         """인증 실패 (4xx 에러는 재시도 안함)"""
         from tasks import DisclosureServiceClient
         import httpx
         
         # Mock 설정 - 401 응답
-        mock_client = MagicMock()
-        mock_response = MagicMock()
+        mock_client, mock_response = mock_httpx_client
         mock_response.status_code = 401
         mock_response.text = "Unauthorized"
         
@@ -152,9 +156,6 @@ class TestDisclosureServiceClient:
             response=mock_response
         )
         mock_response.raise_for_status.side_effect = error
-        mock_client.put.return_value = mock_response
-        mock_client_class.return_value.__enter__ = MagicMock(return_value=mock_client)
-        mock_client_class.return_value.__exit__ = MagicMock(return_value=False)
         
         # 테스트
         client = DisclosureServiceClient(
@@ -176,20 +177,11 @@ class TestDisclosureServiceClient:
 class TestPayloadBuilding:
     """Disclosure Service용 페이로드 생성 테스트"""
     
-    @patch("httpx.Client")
-    def test_payload_structure(self, mock_client_class, sample_disclosure_message):
+    def test_payload_structure(self, mock_httpx_client, sample_disclosure_message):
         """페이로드 구조 확인"""
         from tasks import DisclosureServiceClient
         
-        # Mock 설정
-        mock_client = MagicMock()
-        mock_response = MagicMock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {}
-        mock_response.raise_for_status = MagicMock()
-        mock_client.put.return_value = mock_response
-        mock_client_class.return_value.__enter__ = MagicMock(return_value=mock_client)
-        mock_client_class.return_value.__exit__ = MagicMock(return_value=False)
+        mock_client, _ = mock_httpx_client
         
         client = DisclosureServiceClient(
             base_url="http://localhost:8000",
@@ -212,23 +204,38 @@ class TestPayloadBuilding:
         assert payload["minioObjectName"] == sample_disclosure_message["object_key"]
         assert payload["receptionDate"] == "2024-12-29T00:00:00Z"
 
+    
+    def test_reception_date_cached(self):
+        """같은 접수일자는 캐시된 변환 결과를 재사용"""
+        from tasks import DisclosureServiceClient, _iso_reception_date
+        
+        client = DisclosureServiceClient(
+            base_url="http://localhost:8000",
+            api_key="test-api-key"
+        )
+        _iso_reception_date.cache_clear()
+        
+        assert client._format_reception_date("20241229") == "2024-12-29T00:00:00Z"
+        assert client._format_reception_date(" 20241229 ") == "2024-12-29T00:00:00Z"
+        assert client._format_reception_date("2024-12-29") == "2024-12-29T00:00:00Z"
+        assert client._format_reception_date("") is None
+        assert _iso_reception_date.cache_info().hits == 1
+
 
 class TestRetryLogic:
     """재시도 로직 테스트"""
     
-    @patch("httpx.Client")
     @patch("time.sleep")  # 테스트 속도를 위해 sleep mock
-    def test_retry_on_network_error(self, mock_sleep, mock_client_class, sample_disclosure_message):
+    def test_retry_on_network_error(self, mock_sleep, sample_disclosure_message):
         """네트워크 에러 시 재시도"""
         from tasks import DisclosureServiceClient
         import httpx
         
         # 첫 번째 호출은 실패, 두 번째는 성공
-        mock_client = MagicMock()
-        mock_success_response = MagicMock()
+        mock_client = Mock(spec_set=httpx.Client)
+        mock_success_response = Mock(spec=httpx.Response)
         mock_success_response.status_code = 201
         mock_success_response.json.return_value = {"rcept_no": sample_disclosure_message["rcept_no"]}
-        mock_success_response.raise_for_status = MagicMock()
         
         call_count = [0]
         
@@ -239,8 +246,6 @@ class TestRetryLogic:
             return mock_success_response
         
         mock_client.put.side_effect = side_effect
-        mock_client_class.return_value.__enter__ = MagicMock(return_value=mock_client)
-        mock_client_class.return_value.__exit__ = MagicMock(return_value=False)
         
         # 테스트
         client = DisclosureServiceClient(
@@ -248,6 +253,7 @@ class TestRetryLogic:
             api_key="test-api-key",
             max_retries=3
         )
+        client._client = mock_client
         
         result = client.upsert_disclosure(
             sample_disclosure_message["rcept_no"],
@@ -257,3 +263,56 @@ class TestRetryLogic:
         # 재시도 후 성공
         assert call_count[0] == 2
         assert result["rcept_no"] == sample_disclosure_message["rcept_no"]
+    
+    @patch("time.sleep")
+    def test_idempotency_key_sent(self, mock_sleep, sample_disclosure_message):
+        """재시도 시에도 동일한 Idempotency-Key 헤더 전송"""
+        from tasks import DisclosureServiceClient
+        import httpx
+        
+        mock_client = Mock(spec_set=httpx.Client)
+        mock_success_response = Mock(spec=httpx.Response)
+        mock_success_response.json.return_value = {}
+        mock_client.put.side_effect = [httpx.ConnectError("Connection refused"), mock_success_response]
+        
+        client = DisclosureServiceClient(
+            base_url="http://localhost:8000",
+            api_key="test-api-key",
+            max_retries=3
+        )
+        client._client = mock_client
+        
+        rcept_no = sample_disclosure_message["rcept_no"]
+        client.upsert_disclosure(rcept_no, sample_disclosure_message)
+        
+        keys = [c.kwargs["headers"]["Idempotency-Key"] for c in mock_client.put.call_args_list]
+        assert keys == [rcept_no, rcept_no]
+    
+    @patch("time.sleep")
+    def test_retry_backoff_grows(self, mock_sleep, sample_disclosure_message):
+        """재시도 대기 시간이 지수적으로 증가하고 상한을 넘지 않음"""
+        from tasks import DisclosureServiceClient, RETRY_BACKOFF_BASE, RETRY_BACKOFF_MAX
+        import httpx
+        
+        mock_client = Mock(spec_set=httpx.Client)
+        mock_client.put.side_effect = httpx.ConnectError("Connection refused")
+        
+        client = DisclosureServiceClient(
+            base_url="http://localhost:8000",
+            api_key="test-api-key",
+            max_retries=4
+        )
+        client._client = mock_client
+        
+        with pytest.raises(httpx.ConnectError):
+            client.upsert_disclosure(
+                sample_disclosure_message["rcept_no"],
+                sample_disclosure_message
+            )
+        
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert len(delays) == 3
+        for attempt, delay in enumerate(delays):
+            base = RETRY_BACKOFF_BASE * (2 ** attempt)
+            assert base <= delay <= min(RETRY_BACKOFF_MAX, base * 1.5)
+        assert delays == sorted(delays)
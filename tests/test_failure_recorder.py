@@ -0,0 +1,136 @@
+"""
+Failure Recorder Tests
+
+FailureRecorder 백그라운드 기록 테스트
+"""
+
+import pytest
+import os
+import sys
+import json
+
+# Producer 모듈 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'producer'))
+
+
+class TestFailureRecorder:
+    """FailureRecorder 테스트"""
+
+    def test_close_flushes_pending_records(self, make_disclosure, tmp_path):
+        """close() 호출 시 대기 중인 기록이 모두 파일로 저장됨"""
+        from models.failure_recorder import FailureRecorder
+
+        recorder = FailureRecorder(log_dir=str(tmp_path))
+        for i in range(20):
+            recorder.record(make_disclosure(f"20241229{i:06d}"), "Upload failed")
+        recorder.close()
+
+        files = sorted(os.listdir(tmp_path))
+        assert len(files) == 20
+
+        with open(tmp_path / files[0], encoding='utf-8') as f:
+            data = json.load(f)
+        assert data["failure_reason"] == "Upload failed"
+        assert data["disclosure_details"]["rcept_no"] == "20241229000000"
+
+    def test_disabled_recorder_is_noop(self, make_disclosure):
+        """log_dir 미설정 시 record/close 모두 아무 동작 안 함"""
+        from models.failure_recorder import FailureRecorder
+
+        recorder = FailureRecorder(log_dir=None)
+        recorder.record(make_disclosure("20241229000001"), "ignored")
+        recorder.close()
+
+        assert recorder.log_dir is None
+
+    def test_stdlib_json_fallback(self, make_disclosure, tmp_path, monkeypatch):
+        """orjson 미설치 시 표준 json으로 동일한 내용 기록"""
+        from models import failure_recorder
+        from models.failure_recorder import FailureRecorder
+
+        monkeypatch.setattr(failure_recorder, "HAS_ORJSON", False)
+
+        recorder = FailureRecorder(log_dir=str(tmp_path))
+        recorder.record(make_disclosure("20241229000002"), "실패")
+        recorder.close()
+
+        with open(tmp_path / "20241229000002.json", encoding='utf-8') as f:
+            data = json.load(f)
+        assert data["failure_reason"] == "실패"
+        assert data["disclosure_details"]["corp_name"] == "삼성전자"
+
+    def test_atomic_write_leaves_no_tmp_on_success(self, make_disclosure, tmp_path):
+        """정상 기록 후에는 .json만 남고 .tmp 파일은 남지 않음"""
+        from models.failure_recorder import FailureRecorder
+
+        recorder = FailureRecorder(log_dir=str(tmp_path))
+        recorder.record(make_disclosure("20241229000003"), "Upload failed")
+        recorder.close()
+
+        assert os.listdir(tmp_path) == ["20241229000003.json"]
+
+    @pytest.mark.parametrize("failure", ["write", "replace"])
+    def test_atomic_write_failure_leaves_no_partial_file(self, make_disclosure, tmp_path, monkeypatch, failure):
+        """기록 도중 실패하면 부분 .json도 임시 파일도 남지 않음"""
+        from models import failure_recorder
+        from models.failure_recorder import FailureRecorder
+
+        if failure == "write":
+            # 임시 파일을 연 뒤 write에서 실패 (bytes가 아닌 값)
+            monkeypatch.setattr(failure_recorder, "_dumps", lambda data: "not bytes")
+        else:
+            # 임시 파일 작성 후 rename 단계에서 실패
+            def fail_replace(src, dst):
+                raise OSError("disk full")
+            monkeypatch.setattr(failure_recorder.os, "replace", fail_replace)
+
+        recorder = FailureRecorder(log_dir=str(tmp_path))
+        recorder.record(make_disclosure("20241229000004"), "Upload failed")
+        recorder.close()
+
+        assert os.listdir(tmp_path) == []
+
+
+class TestDisclosureToDict:
+    """Disclosure.to_dict 테스트"""
+
+    def test_to_dict_matches_asdict(self, make_disclosure):
+        """to_dict 결과가 dataclasses.asdict와 동일"""
+        from dataclasses import asdict
+
+        doc = make_disclosure("20241229000001")
+
+        assert doc.to_dict() == asdict(doc)
+
+
+class TestDisclosureFromDict:
+    """Disclosure.from_dict 테스트"""
+
+    def test_from_dict_normalizes_optional_fields(self):
+        """빈 stock_code/rm은 None으로 정규화되고 URL이 생성됨"""
+        from models.disclosure import Disclosure
+
+        doc = Disclosure.from_dict({
+            "corp_code": "00126380", "corp_name": "삼성전자", "stock_code": "",
+            "corp_cls": "Y", "report_nm": "사업보고서", "rcept_no": "20241229000001",
+            "flr_nm": "삼성전자", "rcept_dt": "20241229", "rm": "",
+        })
+
+        assert doc.stock_code is None
+        assert doc.rm is None
+        assert doc.url.endswith("rcpNo=20241229000001")
+
+    def test_from_dict_rejects_missing_or_non_string(self):
+        """필수 키 누락 또는 문자열이 아닌 값은 TypeError"""
+        from models.disclosure import Disclosure
+
+        base = {
+            "corp_code": "00126380", "corp_name": "삼성전자", "corp_cls": "Y",
+            "report_nm": "사업보고서", "rcept_no": "20241229000001", "rcept_dt": "20241229",
+        }
+
+        with pytest.raises(TypeError, match="rcept_dt"):
+            Disclosure.from_dict({k: v for k, v in base.items() if k != "rcept_dt"})
+
+        with pytest.raises(TypeError, match="rcept_no"):
+            Disclosure.from_dict({**base, "rcept_no": 20241229000001})
@@ -0,0 +1,60 @@
+"""
+Health Check Server Tests
+
+HealthCheckServer 시작/종료 테스트
+"""
+
+import pytest
+import os
+import sys
+import threading
+
+# Producer 모듈 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'producer'))
+
+
+class TestHealthCheckServer:
+    """HealthCheckServer 테스트"""
+
+    def test_stop_returns_promptly(self):
+        """stop()이 대기 없이 서버 스레드를 종료"""
+        from health import HealthCheckServer
+
+        server = HealthCheckServer(host="127.0.0.1", port=0)
+        server.start()
+
+        stopper = threading.Thread(target=server.stop, daemon=True)
+        stopper.start()
+        stopper.join(timeout=5)
+
+        assert not stopper.is_alive()
+        assert not server._thread.is_alive()
+
+
+class TestHealthCounters:
+    """헬스 체커 카운터 테스트"""
+
+    def test_counters_are_thread_safe(self):
+        """여러 스레드에서 동시에 기록해도 누락 없이 집계"""
+        from health import DartApiHealthChecker, PollingHealthChecker
+
+        polling = PollingHealthChecker()
+        dart = DartApiHealthChecker()
+
+        def record():
+            for _ in range(10_000):
+                polling.record_processed()
+                polling.record_error()
+                dart.record_failure()
+
+        threads = [threading.Thread(target=record) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        polling.set_running(True)
+        details = polling.check().details
+        assert details["processed_count"] == 80_000
+        assert details["error_count"] == 80_000
+        assert dart.check().details["consecutive_failures"] == 80_000
@@ -7,6 +7,7 @@ MockDartApiClient 기능 테스트
 import pytest
 import os
 import sys
+from unittest.mock import patch
 
 # Producer 모듈 경로 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'producer'))
@@ -15,6 +16,12 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'producer'))
 class TestMockDartApiClient:
     """MockDartApiClient 테스트"""
     
+    @pytest.fixture(autouse=True)
+    def no_simulated_delay(self):
+        """Mock의 시뮬레이션 딜레이(time.sleep) 제거"""
+        with patch("services.mock_dart_client.time.sleep"):
+            yield
+    
     def test_mock_client_initialization(self):
         """Mock 클라이언트 초기화"""
         from services.mock_dart_client import MockDartApiClient
@@ -63,6 +70,14 @@ class TestMockDartApiClient:
         for disclosure in result:
             assert disclosure["rcept_no"].startswith(target_date)
     
+    def test_fetch_rss_updates_returns_none(self):
+        """Mock 모드는 RSS 피드가 없으므로 None 반환"""
+        from services.mock_dart_client import MockDartApiClient
+        
+        client = MockDartApiClient()
+        
+        assert client.fetch_rss_updates() is None
+    
     def test_download_document_returns_bytes(self):
         """문서 다운로드가 bytes를 반환하는지 확인"""
         from services.mock_dart_client import MockDartApiClient
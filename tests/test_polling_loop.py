@@ -0,0 +1,399 @@
+"""
+Polling Loop Tests
+
+polling_loop RSS 변경 감지 및 사이클 처리 테스트
+"""
+
+import pytest
+import os
+import sys
+import logging
+from unittest.mock import MagicMock, patch
+
+# Producer 모듈 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'producer'))
+
+
+def _make_config(rss_enabled: bool = False):
+    config = MagicMock()
+    config.polling.target_date = "" if rss_enabled else "20241229"
+    config.polling.interval_seconds = 60
+    config.polling.rss_interval_seconds = 5
+    config.polling.workers = 2
+    config.polling.max_fail = 3
+    config.dart.rss_enabled = rss_enabled
+    config.celery.task_name = "tasks.process_disclosure"
+    return config
+
+
+def _run_loop(api, config, shutdown, state=None, store=None, celery_app=None):
+    from main import ProcessingState, polling_loop
+
+    polling_loop(
+        api=api,
+        store=store or MagicMock(),
+        config=config,
+        state=state or ProcessingState(),
+        failure_recorder=MagicMock(),
+        shutdown=shutdown,
+        health_server=None,
+        celery_app=celery_app or MagicMock(),
+        logger=logging.getLogger("test"),
+    )
+
+
+def _items(*rcept_nos):
+    """접수번호 목록으로 list.json 항목 생성"""
+    return [
+        {
+            "corp_code": "00126380", "corp_name": "삼성전자", "stock_code": "005930", "corp_cls": "Y",
+            "report_nm": "사업보고서", "rcept_no": rcept_no, "flr_nm": "삼성전자",
+            "rcept_dt": "20241229", "rm": "",
+        }
+        for rcept_no in rcept_nos
+    ]
+
+
+def _message(doc):
+    return {"rcept_no": doc.rcept_no, "object_key": f"{doc.rcept_dt}/{doc.rcept_no}.html"}
+
+
+def _running_shutdown():
+    shutdown = MagicMock()
+    shutdown.is_shutting_down.return_value = False
+    shutdown.wait.return_value = False
+    return shutdown
+
+
+class TestRssGating:
+    """RSS 모드 목록 조회 게이트 테스트"""
+
+    def test_failed_feed_falls_back_to_full_poll(self):
+        """RSS 조회가 실패해도 POLL_INTERVAL이 지나면 전체 폴링 수행"""
+        api = MagicMock()
+        api.fetch_disclosures.return_value = {"status": "013"}
+        api.fetch_rss_updates.return_value = None
+
+        shutdown = MagicMock()
+        shutdown.is_shutting_down.return_value = False
+        # 1주기 종료 대기, RSS 확인 후 대기, 2번째 전체 폴링 후 종료
+        shutdown.wait.side_effect = [True, True, False]
+
+        with patch("main.time") as mock_time:
+            # 첫 폴링(0초), RSS 확인(10초: 주기 이내), 주기 경과(100초) 후 전체 폴링
+            mock_time.monotonic.side_effect = [0, 10, 100, 100]
+            _run_loop(api, _make_config(rss_enabled=True), shutdown)
+
+        assert api.fetch_rss_updates.call_count == 1
+        assert api.fetch_disclosures.call_count == 2
+
+    def test_new_rss_items_trigger_list_call(self):
+        """주기 이내라도 RSS에 처리하지 않은 공시가 있으면 바로 목록 조회"""
+        api = MagicMock()
+        api.fetch_disclosures.return_value = {"status": "013"}
+        api.fetch_rss_updates.return_value = ["20241229000001"]
+
+        shutdown = MagicMock()
+        shutdown.is_shutting_down.return_value = False
+        shutdown.wait.side_effect = [True, False]
+
+        with patch("main.time") as mock_time:
+            mock_time.monotonic.side_effect = [0, 10]
+            _run_loop(api, _make_config(rss_enabled=True), shutdown)
+
+        assert api.fetch_rss_updates.call_count == 1
+        assert api.fetch_disclosures.call_count == 2
+
+    def test_rss_triggered_poll_stops_at_processed_page(self):
+        """RSS로 감지된 조회는 미리 요청하지 않고 새 공시가 없는 페이지에서 멈추며, 정기 전체 폴링 시각을 미루지 않음"""
+        from main import ProcessingState
+
+        pages_requested = []
+        responses = iter([
+            {"status": "013"},
+            {"status": "000", "total_page": 3, "total_count": 250, "list": _items("20241229000101")},
+            {"status": "000", "total_page": 3, "total_count": 250, "list": _items("20241229000001")},
+            {"status": "013"},
+        ])
+
+        def fetch_disclosures(date, page_no, page_count):
+            pages_requested.append(page_no)
+            return next(responses)
+
+        api = MagicMock()
+        api.fetch_disclosures.side_effect = fetch_disclosures
+        api.fetch_rss_updates.return_value = ["20241229000101"]
+        store = MagicMock()
+        store.list_object_names.return_value = set()
+        state = ProcessingState()
+        state.mark_processed("20241229000001")
+
+        shutdown = MagicMock()
+        shutdown.is_shutting_down.return_value = False
+        shutdown.wait.side_effect = [True, True, False]
+
+        with patch("main.time") as mock_time, \
+                patch("main.process_document", side_effect=lambda doc, **kwargs: _message(doc)):
+            # 전체 폴링(0초), RSS 감지 조회(10초), 첫 전체 폴링 기준 주기 경과(65초) 후 전체 폴링
+            mock_time.monotonic.side_effect = [0, 10, 65, 65]
+            _run_loop(api, _make_config(rss_enabled=True), shutdown, state=state, store=store)
+
+        # 1주기 1페이지, RSS 조회 1~2페이지(3페이지는 요청 안 함), 3주기 전체 폴링 1페이지
+        assert pages_requested == [1, 1, 2, 1]
+        assert api.fetch_rss_updates.call_count == 1
+
+
+class TestPaginationFailure:
+    """페이지 조회 중 예외 처리 테스트"""
+
+    def test_publishes_submitted_documents_when_paging_fails(self, sample_dart_api_response):
+        """다음 페이지 조회가 예외로 끝나도 이미 처리한 문서의 메시지는 발행"""
+        def fetch_disclosures(date, page_no, page_count):
+            if page_no == 1:
+                return {"status": "000", "total_page": 2, "total_count": 3, "list": sample_dart_api_response}
+            raise RuntimeError("unexpected page error")
+
+        api = MagicMock()
+        api.fetch_disclosures.side_effect = fetch_disclosures
+        store = MagicMock()
+        store.list_object_names.return_value = set()
+        celery_app = MagicMock()
+
+        shutdown = MagicMock()
+        shutdown.is_shutting_down.return_value = False
+        shutdown.wait.return_value = False
+
+        def process_document(doc, **kwargs):
+            return {"rcept_no": doc.rcept_no, "object_key": f"{doc.rcept_dt}/{doc.rcept_no}.html"}
+
+        with patch("main.process_document", side_effect=process_document):
+            _run_loop(api, _make_config(), shutdown, store=store, celery_app=celery_app)
+
+        published = sorted(c.kwargs["kwargs"]["rcept_no"] for c in celery_app.send_task.call_args_list)
+        assert published == ["20241229000001", "20241229000002"]
+
+    def test_publishes_before_rate_limit_backoff(self, sample_dart_api_response):
+        """요청 제한(020) 응답 시 이미 처리한 문서의 메시지를 먼저 발행한 뒤 대기"""
+        events = []
+
+        def fetch_disclosures(date, page_no, page_count):
+            if page_no == 1:
+                return {"status": "000", "total_page": 2, "total_count": 3, "list": sample_dart_api_response}
+            return {"status": "020", "message": "요청 제한 초과"}
+
+        api = MagicMock()
+        api.fetch_disclosures.side_effect = fetch_disclosures
+        store = MagicMock()
+        store.list_object_names.return_value = set()
+        celery_app = MagicMock()
+        celery_app.send_task.side_effect = lambda name, kwargs, producer: events.append(("send", kwargs["rcept_no"]))
+
+        shutdown = MagicMock()
+        shutdown.is_shutting_down.return_value = False
+
+        def wait(seconds):
+            events.append(("wait", seconds))
+            return False
+
+        shutdown.wait.side_effect = wait
+
+        def process_document(doc, **kwargs):
+            return {"rcept_no": doc.rcept_no, "object_key": f"{doc.rcept_dt}/{doc.rcept_no}.html"}
+
+        with patch("main.process_document", side_effect=process_document):
+            _run_loop(api, _make_config(), shutdown, store=store, celery_app=celery_app)
+
+        backoff_at = events.index(("wait", 3600))
+        sent = sorted(rcept_no for kind, rcept_no in events[:backoff_at] if kind == "send")
+        assert sent == ["20241229000001", "20241229000002"]
+
+
+class TestIncrementalPublish:
+    """처리가 끝난 문서의 메시지 발행 시점 테스트"""
+
+    def test_publishes_earlier_pages_without_waiting_for_cycle(self):
+        """다음 페이지 문서 처리가 끝나기 전에 이전 페이지 문서의 메시지를 발행"""
+        import threading
+        import time
+
+        page1 = ("20241229000001", "20241229000002")
+        page2 = ("20241229000003",)
+        page1_done = threading.Event()
+        processed = []
+        celery_app = MagicMock()
+        sent_before_page2_done = []
+
+        def fetch_disclosures(date, page_no, page_count):
+            if page_no == 1:
+                return {"status": "000", "total_page": 2, "total_count": 3, "list": _items(*page1)}
+            # 1페이지 문서 처리가 끝난 뒤에 2페이지 응답
+            page1_done.wait(2)
+            time.sleep(0.05)
+            return {"status": "000", "total_page": 2, "total_count": 3, "list": _items(*page2)}
+
+        def process_document(doc, **kwargs):
+            if doc.rcept_no in page2:
+                # 2페이지 문서 처리 중에 1페이지 메시지가 이미 발행되었는지 확인
+                deadline = time.monotonic() + 2
+                while celery_app.send_task.call_count < len(page1) and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                sent_before_page2_done.append(celery_app.send_task.call_count)
+            processed.append(doc.rcept_no)
+            if set(page1) <= set(processed):
+                page1_done.set()
+            return _message(doc)
+
+        api = MagicMock()
+        api.fetch_disclosures.side_effect = fetch_disclosures
+        store = MagicMock()
+        store.list_object_names.return_value = set()
+        config = _make_config()
+        config.polling.workers = 4
+
+        with patch("main.process_document", side_effect=process_document):
+            _run_loop(api, config, _running_shutdown(), store=store, celery_app=celery_app)
+
+        assert sent_before_page2_done == [len(page1)]
+        assert celery_app.send_task.call_count == 3
+
+    def test_remaining_messages_published_in_batches(self):
+        """사이클 마무리 시 남은 메시지는 PUBLISH_BATCH_SIZE개씩 발행"""
+        import threading
+
+        rcept_nos = tuple(f"20241229{i:06d}" for i in range(1, 6))
+        release = threading.Event()
+        # 첫 페이지 직후의 발행 시점에는 아직 끝난 문서가 없도록 잠시 대기
+        threading.Timer(0.2, release.set).start()
+
+        def process_document(doc, **kwargs):
+            release.wait(2)
+            return _message(doc)
+
+        api = MagicMock()
+        api.fetch_disclosures.return_value = {
+            "status": "000", "total_page": 1, "total_count": 5, "list": _items(*rcept_nos),
+        }
+        store = MagicMock()
+        store.list_object_names.return_value = set()
+        celery_app = MagicMock()
+
+        with patch("main.process_document", side_effect=process_document), \
+                patch("main.PUBLISH_BATCH_SIZE", 2):
+            _run_loop(api, _make_config(), _running_shutdown(), store=store, celery_app=celery_app)
+
+        assert celery_app.send_task.call_count == 5
+        assert celery_app.producer_or_acquire.call_count == 3
+
+
+class TestPagination:
+    """페이지네이션 처리 테스트"""
+
+    def test_page_shifted_rcept_no_processed_once(self):
+        """조회 중 새 공시로 항목이 밀려 다음 페이지에 다시 나와도 한 번만 처리/발행"""
+        def fetch_disclosures(date, page_no, page_count):
+            if page_no == 1:
+                rcept_nos = ("20241229000003", "20241229000002")
+            else:
+                # 1페이지 마지막 항목이 2페이지 첫 항목으로 밀려 다시 나옴
+                rcept_nos = ("20241229000002", "20241229000001")
+            return {"status": "000", "total_page": 2, "total_count": 4, "list": _items(*rcept_nos)}
+
+        api = MagicMock()
+        api.fetch_disclosures.side_effect = fetch_disclosures
+        store = MagicMock()
+        store.list_object_names.return_value = set()
+        celery_app = MagicMock()
+
+        with patch("main.process_document", side_effect=lambda doc, **kwargs: _message(doc)) as mock_process:
+            _run_loop(api, _make_config(), _running_shutdown(), store=store, celery_app=celery_app)
+
+        processed = [c.kwargs["doc"].rcept_no for c in mock_process.call_args_list]
+        published = [c.kwargs["kwargs"]["rcept_no"] for c in celery_app.send_task.call_args_list]
+        assert processed.count("20241229000002") == 1
+        assert published.count("20241229000002") == 1
+        assert sorted(published) == ["20241229000001", "20241229000002", "20241229000003"]
+
+    def test_prefetched_pages_consumed_in_order(self):
+        """미리 요청한 페이지가 늦게 끝나도 페이지 순서대로 처리"""
+        import time
+        from main import ProcessingState
+
+        pages = {
+            1: ("20241229000006", "20241229000005"),
+            2: ("20241229000004", "20241229000003"),
+            3: ("20241229000002", "20241229000001"),
+        }
+
+        def fetch_disclosures(date, page_no, page_count):
+            if page_no == 2:
+                time.sleep(0.1)  # 3페이지보다 늦게 도착
+            return {"status": "000", "total_page": 3, "total_count": 6, "list": _items(*pages[page_no])}
+
+        api = MagicMock()
+        api.fetch_disclosures.side_effect = fetch_disclosures
+        store = MagicMock()
+        store.list_object_names.return_value = set()
+        celery_app = MagicMock()
+        config = _make_config()
+        config.polling.workers = 4
+
+        state = ProcessingState()
+        consumed = []
+        unprocessed = state.unprocessed
+
+        def record_page(rcept_nos):
+            rcept_nos = list(rcept_nos)
+            consumed.append(rcept_nos[0])
+            return unprocessed(rcept_nos)
+
+        with patch.object(state, "unprocessed", side_effect=record_page), \
+                patch("main.process_document", side_effect=lambda doc, **kwargs: _message(doc)):
+            _run_loop(api, config, _running_shutdown(), state=state, store=store, celery_app=celery_app)
+
+        assert consumed == [pages[1][0], pages[2][0], pages[3][0]]
+        assert celery_app.send_task.call_count == 6
+
+    @pytest.mark.parametrize("interruption", ["shutdown", "error"])
+    def test_remaining_prefetches_cancelled(self, interruption):
+        """페이지 처리 중 종료/예외가 나면 시작되지 않은 미리 요청은 취소되고 처리되지 않음"""
+        import threading
+
+        stop = threading.Event()
+        release = threading.Event()
+        pages_requested = []
+
+        def fetch_disclosures(date, page_no, page_count):
+            pages_requested.append(page_no)
+            if page_no == 2:
+                # 유일한 워커를 잡아 3, 4페이지 요청이 대기열에 남도록 함
+                release.wait(2)
+            return {"status": "000", "total_page": 4, "total_count": 4, "list": _items(f"2024122900000{page_no}")}
+
+        def list_object_names(prefix):
+            # 1페이지 처리 도중 (미리 요청을 제출한 뒤) 중단
+            if interruption == "shutdown":
+                stop.set()
+                return set()
+            raise RuntimeError("storage listing failed")
+
+        api = MagicMock()
+        api.fetch_disclosures.side_effect = fetch_disclosures
+        store = MagicMock()
+        store.list_object_names.side_effect = list_object_names
+        celery_app = MagicMock()
+        config = _make_config()
+        config.polling.workers = 1
+
+        shutdown = MagicMock()
+        shutdown.is_shutting_down.side_effect = stop.is_set
+        shutdown.wait.return_value = False
+
+        timer = threading.Timer(0.3, release.set)
+        timer.start()
+        with patch("main.process_document", side_effect=lambda doc, **kwargs: _message(doc)) as mock_process:
+            _run_loop(api, config, shutdown, store=store, celery_app=celery_app)
+        timer.join()
+
+        assert pages_requested == [1, 2]
+        mock_process.assert_not_called()
+        celery_app.send_task.assert_not_called()
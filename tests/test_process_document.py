@@ -0,0 +1,109 @@
+"""
+Process Document Tests
+
+process_document 저장소 중복 확인 테스트
+"""
+
+import pytest
+import os
+import sys
+import logging
+from unittest.mock import MagicMock
+
+# Producer 모듈 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'producer'))
+
+
+def _process(doc, store, state, stored_rcept_nos):
+    from main import process_document
+
+    return process_document(
+        api=MagicMock(),
+        store=store,
+        doc=doc,
+        polling_date="20241229",
+        state=state,
+        config=MagicMock(),
+        failure_recorder=MagicMock(),
+        health_server=None,
+        logger=logging.getLogger("test"),
+        stored_rcept_nos=stored_rcept_nos,
+    )
+
+
+class TestStorageDedup:
+    """저장소 중복 확인 테스트"""
+
+    def test_list_stored_rcept_nos(self):
+        """날짜 접두사 아래 객체 이름에서 접수번호 추출"""
+        from main import list_stored_rcept_nos
+
+        store = MagicMock()
+        store.list_object_names.return_value = {
+            "20241229/20241229000001.html",
+            "20241229/20241229000002.xml",
+        }
+
+        assert list_stored_rcept_nos(store, "20241229") == {"20241229000001", "20241229000002"}
+        store.list_object_names.assert_called_once_with("20241229/")
+
+    def test_stored_set_skips_per_object_lookup(self, make_disclosure):
+        """사이클 목록에 있는 공시는 객체별 조회 없이 스킵"""
+        from main import ProcessingState
+
+        store = MagicMock()
+        state = ProcessingState()
+
+        result = _process(make_disclosure("20241229000001"), store, state, {"20241229000001"})
+
+        assert result is None
+        store.object_exists.assert_not_called()
+        assert state.get_stats()["skip_count"] == 1
+
+    def test_other_date_falls_back_to_object_lookup(self, make_disclosure):
+        """폴링 날짜와 접수일자가 다르면 객체별 조회로 확인"""
+        from main import ProcessingState
+
+        store = MagicMock()
+        store.object_exists.return_value = True
+        state = ProcessingState()
+
+        result = _process(make_disclosure("20241228000001", rcept_dt="20241228"), store, state, set())
+
+        assert result is None
+        store.object_exists.assert_called_once_with("20241228/20241228000001*")
+
+
+class TestCancellation:
+    """종료 신호로 인한 다운로드 취소 테스트"""
+
+    def test_cancelled_download_is_not_recorded_as_failure(self, make_disclosure):
+        """요청 수 제한 대기 중 종료되면 실패 기록/재시도 횟수에 포함하지 않음"""
+        from main import ProcessingState, process_document
+        from services.dart_api_client import DartApiCancelledError
+
+        api = MagicMock()
+        api.fetch_document_content.side_effect = DartApiCancelledError("shutdown")
+        store = MagicMock()
+        store.object_exists.return_value = False
+        state = ProcessingState()
+        recorder = MagicMock()
+
+        result = process_document(
+            api=api,
+            store=store,
+            doc=make_disclosure("20241229000001"),
+            polling_date="20241229",
+            state=state,
+            config=MagicMock(),
+            failure_recorder=recorder,
+            health_server=None,
+            logger=logging.getLogger("test"),
+        )
+
+        assert result is None
+        recorder.record.assert_not_called()
+        stats = state.get_stats()
+        assert stats["error_count"] == 0
+        assert stats["pending_retry_count"] == 0
+        assert not state.is_processed("20241229000001")
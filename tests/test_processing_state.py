@@ -0,0 +1,71 @@
+"""
+Processing State Tests
+
+ProcessingState 및 BoundedSet 테스트
+"""
+
+import pytest
+import os
+import sys
+
+# Producer 모듈 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'producer'))
+
+
+class TestBoundedSet:
+    """BoundedSet 테스트"""
+
+    def test_evicts_oldest_when_full(self):
+        """용량 초과 시 가장 오래된 항목 제거"""
+        from main import BoundedSet
+
+        s = BoundedSet(capacity=3)
+        for rcept_no in ["1", "2", "3", "4"]:
+            s.add(rcept_no)
+
+        assert len(s) == 3
+        assert "1" not in s
+        assert "4" in s
+
+    def test_re_add_refreshes_order(self):
+        """다시 추가된 항목은 최신으로 갱신되어 제거 대상에서 밀려남"""
+        from main import BoundedSet
+
+        s = BoundedSet(capacity=2)
+        s.add("1")
+        s.add("2")
+        s.add("1")
+        s.add("3")
+
+        assert "1" in s
+        assert "2" not in s
+
+
+class TestProcessingState:
+    """ProcessingState 테스트"""
+
+    def test_permanent_failure_after_max_fail(self):
+        """max_fail 횟수 실패 시 영구 실패로 처리"""
+        from main import ProcessingState
+
+        state = ProcessingState()
+
+        assert state.record_failure("20241229000001", max_fail=2) is False
+        assert state.record_failure("20241229000001", max_fail=2) is True
+        assert state.is_processed("20241229000001")
+
+        stats = state.get_stats()
+        assert stats["permanently_failed_count"] == 1
+        assert stats["pending_retry_count"] == 0
+
+    def test_unprocessed_filters_known_rcept_nos(self):
+        """처리 완료/영구 실패 접수번호는 제외하고 반환"""
+        from main import ProcessingState
+
+        state = ProcessingState()
+        state.mark_processed("20241229000001")
+        state.record_failure("20241229000002", max_fail=1)
+
+        result = state.unprocessed(["20241229000001", "20241229000002", "20241229000003"])
+
+        assert result == {"20241229000003"}
@@ -0,0 +1,64 @@
+"""
+Publish Messages Tests
+
+publish_messages Celery 일괄 발행 테스트
+"""
+
+import pytest
+import os
+import sys
+import logging
+from unittest.mock import MagicMock
+
+# Producer 모듈 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'producer'))
+
+
+def _item(doc):
+    """발행 대상 (Disclosure, 메시지) 쌍"""
+    return doc, {"rcept_no": doc.rcept_no, "object_key": f"{doc.rcept_dt}/{doc.rcept_no}.html"}
+
+
+class TestPublishMessages:
+    """publish_messages 테스트"""
+
+    def test_publishes_all_with_single_producer(self, make_disclosure):
+        """모든 메시지가 하나의 producer로 발행됨"""
+        from celery import Celery
+        from main import publish_messages
+
+        app = Celery('test', broker='memory://')
+        config = MagicMock()
+        config.celery.task_name = "tasks.process_disclosure"
+        recorder = MagicMock()
+
+        sent = []
+        app.send_task = lambda name, kwargs, producer: sent.append((kwargs["rcept_no"], producer))
+
+        items = [_item(make_disclosure(f"20241229{i:06d}")) for i in range(3)]
+        publish_messages(app, config, items, recorder, logging.getLogger("test"))
+
+        assert [rcept_no for rcept_no, _ in sent] == [doc.rcept_no for doc, _ in items]
+        assert len({id(producer) for _, producer in sent}) == 1
+        recorder.record.assert_not_called()
+
+    def test_failed_send_is_recorded(self, make_disclosure):
+        """발행 실패한 메시지만 실패 기록됨"""
+        from celery import Celery
+        from main import publish_messages
+
+        app = Celery('test', broker='memory://')
+        config = MagicMock()
+        recorder = MagicMock()
+
+        def send_task(name, kwargs, producer):
+            if kwargs["rcept_no"].endswith("1"):
+                raise ConnectionError("broker down")
+
+        app.send_task = send_task
+
+        items = [_item(make_disclosure("20241229000000")), _item(make_disclosure("20241229000001"))]
+        publish_messages(app, config, items, recorder, logging.getLogger("test"))
+
+        recorder.record.assert_called_once()
+        assert recorder.record.call_args[0][0].rcept_no == "20241229000001"
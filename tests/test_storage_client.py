@@ -0,0 +1,51 @@
+"""
+Storage Client Tests
+
+MinIOClient 업로드/존재 확인 테스트
+"""
+
+import pytest
+import os
+import sys
+
+# Producer 모듈 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'producer'))
+
+
+def _make_store():
+    from services.storage_client import MinIOClient
+
+    return MinIOClient(
+        endpoint="localhost:9000",
+        access_key="minioadmin",
+        secret_key="minioadmin123",
+        bucket_name="test-bucket",
+    )
+
+
+class TestMinIOClient:
+    """MinIOClient 테스트"""
+
+    def test_upload_then_exists(self, mock_minio_client):
+        """업로드한 객체는 정확한 이름과 와일드카드로 모두 확인됨"""
+        store = _make_store()
+
+        assert store.upload_document("20241229/20241229000001.html", b"<html></html>", None)
+
+        assert mock_minio_client.objects["20241229/20241229000001.html"] == b"<html></html>"
+        assert store.object_exists("20241229/20241229000001.html")
+        assert store.object_exists("20241229/20241229000001*")
+        assert not store.object_exists("20241229/20241229000002.html")
+        assert not store.object_exists("20241229/20241229000002*")
+
+    def test_list_object_names(self, mock_minio_client):
+        """접두사 아래 객체 이름만 수집"""
+        store = _make_store()
+        store.upload_document("20241229/20241229000001.html", b"a", "text/html")
+        store.upload_document("20241229/20241229000002.xml", b"b", "application/xml")
+        store.upload_document("20241230/20241230000001.html", b"c", "text/html")
+
+        assert store.list_object_names("20241229/") == {
+            "20241229/20241229000001.html",
+            "20241229/20241229000002.xml",
+        }